@@ -60,6 +60,7 @@ def operation(
     models_in: list[str] | None = None,
     models_out: list[str] | None = None,
     stage: str | None = None,
+    pure: bool = False,
 ):
     """Decorator to register an operation with typed input/output schemas.
 
@@ -67,6 +68,10 @@ def operation(
 
     Operations are automatically tracked and orchestrated by Prefect when using
     hierarchical naming convention (e.g., "flow.step.substep").
+
+    Mark an operation ``pure=True`` when its result depends only on its input
+    (no I/O, no global mutation). Generated surfaces then bind the function
+    directly instead of resolving it through the registry on every call.
     """
 
     def _wrap(func_or_cls: Any) -> Any:
@@ -92,6 +97,7 @@ def operation(
             models_in=models_in or [],
             models_out=models_out or [],
             stage=stage,
+            pure=pure,
         )
         OperationRegistry.register(meta)
 
@@ -5,8 +5,81 @@ which populates the ModelRegistry and OperationRegistry.
 """
 
 import importlib.util
+import os
+import pkgutil
 import sys
+from importlib.machinery import ModuleSpec
 from pathlib import Path
+from types import ModuleType
+
+
+def _find_file_spec(module_name: str, path: str) -> ModuleSpec | None:
+    """Build a module spec for ``path`` via the directory's shared FileFinder.
+
+    ``pkgutil.get_importer`` keeps one finder per directory in
+    ``sys.path_importer_cache``, so sibling files reuse its cached listing.
+    Falls back to ``spec_from_file_location`` when the finder resolves the
+    name to something else (e.g. a package of the same name).
+    """
+    finder = pkgutil.get_importer(os.path.dirname(path))
+    find_spec = getattr(finder, "find_spec", None)
+    spec = find_spec(module_name) if find_spec else None
+    if spec is not None and spec.origin == path:
+        return spec
+    return importlib.util.spec_from_file_location(module_name, path)
+
+
+# (mtime_ns, size) of each file when cached_import() last executed it
+_loaded_stats: dict[str, tuple[int, int]] = {}
+
+
+def _file_stat(path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of ``path``, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def cached_import(module_name: str, path: str | os.PathLike[str]) -> ModuleType | None:
+    """Import a file as ``module_name``, reusing ``sys.modules`` when possible.
+
+    A module already registered under the same name, loaded from the same file
+    and unchanged since (same mtime and size) is returned as-is, so re-running
+    discovery does not re-execute it. An edited file is executed again into a
+    fresh module, re-running its decorators.
+
+    Args:
+        module_name: Dotted name to register the module under
+        path: Path to the ``.py`` file
+
+    Returns:
+        The imported module, or None if no loader could be created
+    """
+    path = os.path.abspath(path)
+    stat = _file_stat(path)
+    module = sys.modules.get(module_name)
+    if (
+        module is not None
+        and getattr(module, "__file__", None) == path
+        and _loaded_stats.get(path) == stat
+    ):
+        return module
+
+    spec = _find_file_spec(module_name, path)
+    if not spec or not spec.loader:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    _loaded_stats[path] = stat
+    return module
 
 
 def discover_and_import(project_dir: Path) -> tuple[list, list]:
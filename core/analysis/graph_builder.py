@@ -24,7 +24,7 @@ def build_graph_from_registries(project_name: str) -> RegistryGraph:
     graph = RegistryGraph(project_name)
 
     # Add DataModel nodes
-    for model_info in ModelRegistry.list_all():
+    for model_info in ModelRegistry.iter_all():
         # Extract fields from document class
         fields = _extract_fields_from_class(model_info.document_cls)
 
@@ -55,7 +55,7 @@ def build_graph_from_registries(project_name: str) -> RegistryGraph:
     # Extract flows and tasks from operations
     flows_created = set()
 
-    for op_meta in OperationRegistry.list_all():
+    for op_meta in OperationRegistry.iter_all():
         # Extract flow hierarchy from operation name
         # e.g., "user.create.validate_email" → flows: ["user", "user.create"]
         flow_parts = op_meta.name.split(".")
@@ -132,21 +132,22 @@ def _extract_fields_from_class(cls: type) -> dict[str, dict[str, str]]:
     """
     fields = {}
 
-    # Try to get fields from Pydantic/Beanie model
-    if hasattr(cls, "__fields__"):
-        # Pydantic v1
-        for field_name, field_info in cls.__fields__.items():
-            fields[field_name] = {
-                "type": str(field_info.type_),
-                "required": field_info.required,
-            }
-    elif hasattr(cls, "model_fields"):
+    # Try to get fields from Pydantic/Beanie model. Check v2 first: v2 still
+    # exposes __fields__, but accessing it raises a deprecation warning
+    if hasattr(cls, "model_fields"):
         # Pydantic v2
         for field_name, field_info in cls.model_fields.items():
             fields[field_name] = {
                 "type": str(field_info.annotation),
                 "required": field_info.is_required(),
             }
+    elif hasattr(cls, "__fields__"):
+        # Pydantic v1
+        for field_name, field_info in cls.__fields__.items():
+            fields[field_name] = {
+                "type": str(field_info.type_),
+                "required": field_info.required,
+            }
     elif hasattr(cls, "__annotations__"):
         # Fallback: use type annotations
         for field_name, field_type in cls.__annotations__.items():
@@ -10,6 +10,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+# (name, description, category, models_in, models_out)
+OperationRow = tuple[str, str, str, tuple[str, ...], tuple[str, ...]]
+
 
 class MermaidGraphGenerator:
     """Generate Mermaid diagrams from registry data."""
@@ -23,6 +26,27 @@ class MermaidGraphGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def operation_rows(operations: list[Any]) -> list[OperationRow]:
+        """Flatten operation entries into the tuples the flow diagram reads.
+
+        Args:
+            operations: List of OperationRegistry entries
+
+        Returns:
+            One (name, description, category, models_in, models_out) row per operation
+        """
+        return [
+            (
+                op.name,
+                getattr(op, "description", "No description"),
+                getattr(op, "category", "general"),
+                tuple(getattr(op, "models_in", [])),
+                tuple(getattr(op, "models_out", [])),
+            )
+            for op in operations
+        ]
+
     def generate_operation_flow(
         self,
         models: list[Any],
@@ -36,6 +60,27 @@ class MermaidGraphGenerator:
             models: List of ModelRegistry entries
             operations: List of OperationRegistry entries
 
+        Returns:
+            Path to generated file
+        """
+        return self.generate_operation_flow_from_rows(
+            [model.name for model in models], self.operation_rows(operations)
+        )
+
+    def generate_operation_flow_from_rows(
+        self,
+        model_names: list[str],
+        op_rows: list[OperationRow],
+    ) -> Path:
+        """Generate operation flow diagram from pre-extracted rows.
+
+        Lets callers that already flattened the registries (e.g. to hash them)
+        skip a second pass of attribute lookups.
+
+        Args:
+            model_names: Names of registered models
+            op_rows: Rows as returned by operation_rows()
+
         Returns:
             Path to generated file
         """
@@ -47,21 +92,15 @@ class MermaidGraphGenerator:
         ]
 
         # Add model nodes
-        for model in models:
-            model_name = model.name
+        for model_name in model_names:
             lines.append(f'    {model_name}["{model_name}"]')
 
         # Add operation edges
-        for op in operations:
-            models_in = getattr(op, "models_in", [])
-            models_out = getattr(op, "models_out", [])
-            description = getattr(op, "description", op.name)
-
+        for op_name, _, _, models_in, models_out in op_rows:
             # Create edges from input models through operation to output models
             for model_in in models_in:
                 for model_out in models_out:
-                    edge_label = op.name
-                    lines.append(f"    {model_in} -->|{edge_label}| {model_out}")
+                    lines.append(f"    {model_in} -->|{op_name}| {model_out}")
 
         lines.extend(
             [
@@ -79,15 +118,10 @@ class MermaidGraphGenerator:
         )
 
         # Add operation details
-        for op in operations:
-            models_in = getattr(op, "models_in", [])
-            models_out = getattr(op, "models_out", [])
-            description = getattr(op, "description", "No description")
-            category = getattr(op, "category", "general")
-
+        for op_name, description, category, models_in, models_out in op_rows:
             lines.extend(
                 [
-                    f"### {op.name}",
+                    f"### {op_name}",
                     "",
                     f"**Description**: {description}",
                     f"**Category**: {category}",
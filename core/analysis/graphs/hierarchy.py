@@ -11,16 +11,21 @@ The hierarchy defines:
 - Parallelization opportunities (operations at same level with same I/O)
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedName:
-    """Represents a parsed hierarchical operation name."""
+    """Represents a parsed hierarchical operation name.
+
+    Instances are immutable because HierarchyParser.parse() shares one
+    instance per distinct name.
+    """
 
     full_name: str  # e.g., "scraping.stepstone.fetch"
-    hierarchy: list[str]  # e.g., ["scraping", "stepstone", "fetch"]
+    hierarchy: tuple[str, ...]  # e.g., ("scraping", "stepstone", "fetch")
     level: int  # e.g., 3 (number of components)
     step: str  # e.g., "fetch" (last component)
     parent: Optional[str]  # e.g., "scraping.stepstone"
@@ -86,7 +91,8 @@ class HierarchyParser:
             name: Operation name (e.g., "scraping.stepstone.fetch")
 
         Returns:
-            ParsedName with full structure
+            ParsedName with full structure (cached; the same instance is
+            returned for repeated names)
 
         Raises:
             ValueError: If name is invalid
@@ -94,6 +100,12 @@ class HierarchyParser:
         if not name or not isinstance(name, str):
             raise ValueError("Operation name must be non-empty string")
 
+        return HierarchyParser._parse_str(name)
+
+    @staticmethod
+    @functools.cache
+    def _parse_str(name: str) -> ParsedName:
+        """Parse a non-empty string name (memoized; invalid names are not cached)."""
         if not name.replace(".", "").replace("_", "").isalnum():
             raise ValueError(
                 f"Operation name must contain only alphanumeric, dots, "
@@ -103,7 +115,7 @@ class HierarchyParser:
         parts = name.split(HierarchyParser.SEPARATOR)
 
         # Remove empty parts
-        parts = [p for p in parts if p]
+        parts = tuple(p for p in parts if p)
 
         if not parts:
             raise ValueError(f"Operation name cannot be empty or only dots: {name}")
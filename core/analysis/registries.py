@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -48,6 +48,7 @@ class OperationMetadata:
     models_in: list[str] = field(default_factory=list)
     models_out: list[str] = field(default_factory=list)
     stage: str | None = None
+    pure: bool = False
 
 
 class ModelRegistry:
@@ -69,6 +70,22 @@ class ModelRegistry:
     def list_all(cls) -> list[ModelInfo]:
         return list(cls._models.values())
 
+    @classmethod
+    def iter_all(cls) -> Iterator[ModelInfo]:
+        """Iterate registrations without copying (do not register while iterating)."""
+        return iter(cls._models.values())
+
+    @classmethod
+    def snapshot(cls) -> dict[str, ModelInfo]:
+        """Copy of the current registrations, for restore()."""
+        return dict(cls._models)
+
+    @classmethod
+    def restore(cls, snapshot: dict[str, ModelInfo]) -> None:
+        """Replace the registrations with a snapshot() result."""
+        cls._models.clear()
+        cls._models.update(snapshot)
+
     @classmethod
     def clear(cls) -> None:
         cls._models.clear()
@@ -93,10 +110,26 @@ class OperationRegistry:
     def list_all(cls) -> list[OperationMetadata]:
         return list(cls._ops.values())
 
+    @classmethod
+    def iter_all(cls) -> Iterator[OperationMetadata]:
+        """Iterate registrations without copying (do not register while iterating)."""
+        return iter(cls._ops.values())
+
     @classmethod
     def by_category(cls, category: str) -> list[OperationMetadata]:
         return [op for op in cls._ops.values() if op.category == category]
 
+    @classmethod
+    def snapshot(cls) -> dict[str, OperationMetadata]:
+        """Copy of the current registrations, for restore()."""
+        return dict(cls._ops)
+
+    @classmethod
+    def restore(cls, snapshot: dict[str, OperationMetadata]) -> None:
+        """Replace the registrations with a snapshot() result."""
+        cls._ops.clear()
+        cls._ops.update(snapshot)
+
     @classmethod
     def clear(cls) -> None:
         cls._ops.clear()
@@ -15,6 +15,9 @@ try:
 except ImportError:
     yaml = None
 
+# libyaml-backed loader when available; same semantics as yaml.safe_load
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 
 class ConfigManager:
     """Manage project configuration and port allocation."""
@@ -150,7 +153,7 @@ class ConfigManager:
 
         try:
             content = self.config_path.read_text()
-            self._config = yaml.safe_load(content) or {}
+            self._config = yaml.load(content, Loader=_YAML_LOADER) or {}
             self._validate_config(self._config)
             return self._config
         except yaml.YAMLError as e:
@@ -24,10 +24,15 @@ class CodeGenerator:
         self.output_dir.mkdir(exist_ok=True)
 
     def get_metadata_hash(self) -> str:
-        """Get hash of current registry state to detect changes."""
+        """Get hash of current registry state to detect changes.
+
+        Covers every class and function the generated code imports by path,
+        so moving a schema or operation to another module also regenerates.
+        """
         models_data = [
             {
                 "name": m.name,
+                "class": _qualified_name(m.document_cls),
                 "searchable": m.searchable_fields,
                 "sortable": m.sortable_fields,
                 "ui": m.ui_hints,
@@ -39,8 +44,10 @@ class CodeGenerator:
             {
                 "name": op.name,
                 "category": op.category,
-                "inputs": op.input_schema.__name__,
-                "outputs": op.output_schema.__name__,
+                "inputs": _qualified_name(op.input_schema),
+                "outputs": _qualified_name(op.output_schema),
+                "function": _qualified_name(op.function),
+                "pure": op.pure,
             }
             for op in OperationRegistry.list_all()
         ]
@@ -48,8 +55,13 @@ class CodeGenerator:
         combined = json.dumps({"models": models_data, "ops": ops_data}, sort_keys=True)
         return hashlib.sha256(combined.encode()).hexdigest()[:12]
 
-    def needs_regeneration(self, output_file: Path) -> bool:
-        """Check if output file needs regeneration."""
+    def needs_regeneration(self, output_file: Path, metadata_hash: str | None = None) -> bool:
+        """Check if output file needs regeneration.
+
+        Args:
+            output_file: Generated file to check
+            metadata_hash: Precomputed get_metadata_hash() (computed if omitted)
+        """
         if not output_file.exists():
             return True
 
@@ -58,12 +70,19 @@ class CodeGenerator:
         if not hash_file.exists():
             return True
 
-        current_hash = self.get_metadata_hash()
+        current_hash = metadata_hash or self.get_metadata_hash()
         stored_hash = hash_file.read_text().strip()
 
         return current_hash != stored_hash
 
-    def save_hash(self, output_file: Path) -> None:
-        """Save current metadata hash."""
+    def save_hash(self, output_file: Path, metadata_hash: str | None = None) -> None:
+        """Save metadata hash (the current registry state if not given)."""
         hash_file = output_file.with_suffix(".hash")
-        hash_file.write_text(self.get_metadata_hash())
+        hash_file.write_text(metadata_hash or self.get_metadata_hash())
+
+
+def _qualified_name(obj: object) -> str:
+    """Import path of a class or function (e.g. "app.models.Task")."""
+    module = getattr(obj, "__module__", None) or ""
+    name = getattr(obj, "__qualname__", None) or type(obj).__qualname__
+    return f"{module}.{name}"
@@ -6,6 +6,7 @@ Output: run_cache/generated_api.py
 
 from __future__ import annotations
 
+import inspect
 from pathlib import Path
 from typing import Any
 
@@ -25,7 +26,9 @@ class FastAPIGenerator(CodeGenerator):
         """Generate FastAPI routes file."""
         output_file = self.output_dir / "generated_api.py"
 
-        if not self.needs_regeneration(output_file):
+        # Hash the registries once: the same value is checked and then saved
+        metadata_hash = self.get_metadata_hash()
+        if not self.needs_regeneration(output_file, metadata_hash):
             print(f"✓ {output_file} is up to date (hash match)")
             return output_file
 
@@ -60,6 +63,11 @@ class FastAPIGenerator(CodeGenerator):
             input_class = op.input_schema.__name__
             output_class = op.output_schema.__name__
             operation_imports.add(f"from {input_module} import {input_class}, {output_class}")
+            if self._is_direct_callable(op):
+                fn = op.function
+                operation_imports.add(
+                    f"from {fn.__module__} import {fn.__name__} as {self._direct_alias(op)}"
+                )
 
         if operation_imports:
             code_parts.append("# Operation schema imports")
@@ -89,7 +97,7 @@ class FastAPIGenerator(CodeGenerator):
 
         code = "\n".join(code_parts)
         output_file.write_text(code)
-        self.save_hash(output_file)
+        self.save_hash(output_file, metadata_hash)
 
         print(f"✓ Generated {len(code.splitlines())} lines of API code")
         return output_file
@@ -200,11 +208,36 @@ async def delete_{model_lower}(item_id: str):
     return {{"success": True}}
 '''
 
+    @staticmethod
+    def _is_direct_callable(op: Any) -> bool:
+        """Whether a pure operation can be imported and called without the registry."""
+        fn = op.function
+        return (
+            getattr(op, "pure", False)
+            and inspect.isfunction(fn)
+            and fn.__qualname__ == fn.__name__
+        )
+
+    @staticmethod
+    def _direct_alias(op: Any) -> str:
+        """Module-level alias for a directly imported pure operation."""
+        return "_" + op.name.replace(".", "_") + "_fn"
+
     def _generate_operation_endpoint(self, op: Any) -> str:
         """Generate endpoint for a single operation."""
         input_class = op.input_schema.__name__
         output_class = op.output_schema.__name__
 
+        if self._is_direct_callable(op):
+            # Pure operations are bound at import time: no registry lookup per request
+            dispatch = f"result = await {self._direct_alias(op)}(input_data)"
+        else:
+            dispatch = (
+                "# Get operation function from registry\n"
+                f'    op_meta = OperationRegistry.get("{op.name}")\n'
+                "    result = await op_meta.function(input_data)"
+            )
+
         return f'''
 @operations_router.post("/{op.name}", summary="{op.description}")
 async def {op.name}_endpoint(input_data: {input_class}) -> {output_class}:
@@ -215,9 +248,7 @@ async def {op.name}_endpoint(input_data: {input_class}) -> {output_class}:
     Tags: {', '.join(op.tags)}
     Models: {', '.join(op.models_in + op.models_out)}
     """
-    # Get operation function from registry
-    op_meta = OperationRegistry.get("{op.name}")
-    result = await op_meta.function(input_data)
+    {dispatch}
 
     return result
 '''
@@ -176,7 +176,7 @@ class OrchestrationCompiler:
         3. Group standalones into a single standalones_flow
         4. Detect parallel groups within each flow
         """
-        from ..hierarchy import HierarchyParser
+        from ...analysis.graphs.hierarchy import HierarchyParser
 
         # Group operations by parent
         grouped = HierarchyParser.group_by_parent([op.name for op in operations])
@@ -213,7 +213,7 @@ class OrchestrationCompiler:
         Returns:
             FlowDefinition for this parent
         """
-        from ..hierarchy import HierarchyParser
+        from ...analysis.graphs.hierarchy import HierarchyParser
 
         # Create flow name from parent
         # "scraping.stepstone" -> "scraping_stepstone_flow"
@@ -6,7 +6,7 @@ Generates Prefect @flow and @task decorators from flow definitions.
 Produces valid Python code that:
 1. Defines tasks for each operation
 2. Creates flows that orchestrate tasks
-3. Handles parallel execution via asyncio.gather
+3. Handles parallel execution via asyncio.TaskGroup
 4. Manages dependencies via data flow
 """
 
@@ -207,7 +207,7 @@ class PrefectCodeGenerator:
         """Generate the body of a flow function.
 
         Handles:
-        1. Parallel execution groups (asyncio.gather)
+        1. Parallel execution groups (asyncio.TaskGroup)
         2. Sequential dependencies (await task())
         3. Data passing between tasks
 
@@ -275,17 +275,12 @@ class PrefectCodeGenerator:
                     else:
                         task_calls.append(f"{task_name}()")
 
-                # Generate asyncio.gather call
-                task_calls_str = ",\n".join(
-                    self._indent(tc) for tc in task_calls
-                )
-                var_assignments = ", ".join(
-                    f"{op}_result" for op in group
-                )
-
-                lines.append(f"{var_assignments} = await asyncio.gather(")
-                lines.append(task_calls_str + ",")
-                lines.append(")")
+                # Generate asyncio.TaskGroup block (cancels siblings on failure)
+                lines.append("async with asyncio.TaskGroup() as tg:")
+                for op_name, tc in zip(group, task_calls, strict=True):
+                    lines.append(self._indent(f"{op_name}_future = tg.create_task({tc})"))
+                for op_name in group:
+                    lines.append(f"{op_name}_result = {op_name}_future.result()")
 
                 # Store variable names
                 for op_name in group:
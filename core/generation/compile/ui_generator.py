@@ -21,7 +21,9 @@ class TypeScriptUIConfigGenerator(CodeGenerator):
         """Generate TypeScript UI config file."""
         output_file = self.output_dir / "generated_ui_config.ts"
 
-        if not self.needs_regeneration(output_file):
+        # Hash the registries once: the same value is checked and then saved
+        metadata_hash = self.get_metadata_hash()
+        if not self.needs_regeneration(output_file, metadata_hash):
             print(f"✓ {output_file} is up to date (hash match)")
             return output_file
 
@@ -84,7 +86,7 @@ class TypeScriptUIConfigGenerator(CodeGenerator):
 
         code = "\n".join(code_parts)
         output_file.write_text(code)
-        self.save_hash(output_file)
+        self.save_hash(output_file, metadata_hash)
 
         print(f"✓ Generated {len(code.splitlines())} lines of TypeScript config")
         return output_file
@@ -0,0 +1,34 @@
+"""Shared launcher for the auto-generated API server scripts.
+
+Builds one ``uvicorn.Config`` and runs it through ``uvicorn.Server`` directly,
+so every runner script shares the same server setup.
+"""
+
+import uvicorn
+
+APP = "run_cache.generated_api:app"
+
+
+def serve(port: int, title: str, note: str) -> None:
+    """Print the startup banner and run the generated API without hot reload.
+
+    Args:
+        port: Port to listen on
+        title: Banner title line
+        note: Extra line printed under the endpoint list
+    """
+    print("\n" + "=" * 80)
+    print(f"🚀 {title}")
+    print("=" * 80)
+    print("")
+    print(f"📚 API Documentation: http://localhost:{port}/docs")
+    print(f"🏥 Health Check:      http://localhost:{port}/health")
+    print(f"🔌 API Base URL:      http://localhost:{port}/api/v1")
+    print("")
+    print(note)
+    print("")
+
+    # loop/http default to "auto": uvloop and httptools when installed
+    # (uvicorn[standard]), stdlib asyncio/h11 otherwise
+    config = uvicorn.Config(APP, host="0.0.0.0", port=port, reload=False)
+    uvicorn.Server(config).run()
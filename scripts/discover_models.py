@@ -1,14 +1,16 @@
 """Discover datamodels in the project."""
 
+import os
 import sys
 from pathlib import Path
 
-from core.config_manager import ConfigManager
-from core.analysis.registries import ModelRegistry
-
 
 def main():
     """Discover and list all datamodels."""
+    from core.analysis.discovery.import_scanner import cached_import
+    from core.analysis.registries import ModelRegistry
+    from core.config_manager import ConfigManager
+
     config_file = sys.argv[1] if len(sys.argv) > 1 else "."
     config_path = Path(config_file)
 
@@ -18,29 +20,32 @@ def main():
         config = config_mgr.load()
         models_dirs, _ = config_mgr.get_discovery_dirs()
 
-        # Change to project root so imports work
-        old_cwd = Path.cwd()
-        import os
-        os.chdir(config_path)
+        # Make the project importable (once, however many directories are scanned).
+        # Directories are resolved against the project path rather than by
+        # chdir-ing into it, so the caller's working directory is left alone.
+        project_path = str(config_path.resolve())
+        if project_path not in sys.path:
+            sys.path.insert(0, project_path)
 
         # Import and register models
         for model_dir in models_dirs:
-            model_path = Path(model_dir)
+            model_path = config_path / model_dir
             if model_path.exists():
-                sys.path.insert(0, str(config_path))
-                for py_file in model_path.glob("*.py"):
-                    if py_file.name != "__init__.py":
+                with os.scandir(model_path) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".py") or entry.name == "__init__.py":
+                            continue
                         try:
-                            module_name = f"{model_dir.replace('/', '.')}.{py_file.stem}"
-                            __import__(module_name)
+                            module_name = f"{model_dir.replace('/', '.')}.{entry.name[:-3]}"
+                            cached_import(module_name, entry.path)
                         except Exception as e:
-                            print(f"   ⚠️  Failed to import {py_file}: {e}", file=sys.stderr)
+                            print(f"   ⚠️  Failed to import {entry.path}: {e}", file=sys.stderr)
 
         if ModelRegistry._models:
             print(f"\n✅ Found {len(ModelRegistry._models)} datamodels:\n")
             for model_name, model_meta in ModelRegistry._models.items():
                 print(f"   • {model_name}")
-                if hasattr(model_meta, 'description') and model_meta.description:
+                if model_meta.description:
                     print(f"     {model_meta.description}")
         else:
             print("\n⚠️  No datamodels found. Check your models directory.")
@@ -1,14 +1,16 @@
 """Discover operations in the project."""
 
+import os
 import sys
 from pathlib import Path
 
-from core.config_manager import ConfigManager
-from core.analysis.registries import OperationRegistry
-
 
 def main():
     """Discover and list all operations."""
+    from core.analysis.discovery.import_scanner import cached_import
+    from core.analysis.registries import OperationRegistry
+    from core.config_manager import ConfigManager
+
     config_file = sys.argv[1] if len(sys.argv) > 1 else "."
     config_path = Path(config_file)
 
@@ -18,29 +20,32 @@ def main():
         config = config_mgr.load()
         _, ops_dirs = config_mgr.get_discovery_dirs()
 
-        # Change to project root so imports work
-        old_cwd = Path.cwd()
-        import os
-        os.chdir(config_path)
+        # Make the project importable (once, however many directories are scanned).
+        # Directories are resolved against the project path rather than by
+        # chdir-ing into it, so the caller's working directory is left alone.
+        project_path = str(config_path.resolve())
+        if project_path not in sys.path:
+            sys.path.insert(0, project_path)
 
         # Import and register operations
         for ops_dir in ops_dirs:
-            ops_path = Path(ops_dir)
+            ops_path = config_path / ops_dir
             if ops_path.exists():
-                sys.path.insert(0, str(config_path))
-                for py_file in ops_path.glob("*.py"):
-                    if py_file.name != "__init__.py":
+                with os.scandir(ops_path) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".py") or entry.name == "__init__.py":
+                            continue
                         try:
-                            module_name = f"{ops_dir.replace('/', '.')}.{py_file.stem}"
-                            __import__(module_name)
+                            module_name = f"{ops_dir.replace('/', '.')}.{entry.name[:-3]}"
+                            cached_import(module_name, entry.path)
                         except Exception as e:
-                            print(f"   ⚠️  Failed to import {py_file}: {e}", file=sys.stderr)
+                            print(f"   ⚠️  Failed to import {entry.path}: {e}", file=sys.stderr)
 
         if OperationRegistry._ops:
             print(f"\n✅ Found {len(OperationRegistry._ops)} operations:\n")
             for op_name, op_meta in OperationRegistry._ops.items():
                 print(f"   • {op_name}")
-                if hasattr(op_meta, 'description') and op_meta.description:
+                if op_meta.description:
                     print(f"     {op_meta.description}")
         else:
             print("\n⚠️  No operations found. Check your operations directory.")
@@ -8,7 +8,6 @@ Usage:
     python -m scripts.discovery_main .  # Use main.py in current dir
 """
 
-import importlib.util
 import sys
 from pathlib import Path
 
@@ -46,15 +45,12 @@ def discover_via_main(main_path: Path) -> tuple[list, list]:
     print(f"   └─ Entrypoint: {main_file.name}\n")
 
     # Import main.py to trigger decorators
+    from core.analysis.discovery.import_scanner import cached_import
+
     try:
-        spec = importlib.util.spec_from_file_location("main", main_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            sys.modules["main"] = module
-            spec.loader.exec_module(module)
-            print(f"   ✓ Imported: {main_file.name}\n")
-        else:
+        if cached_import("main", main_file) is None:
             raise ImportError(f"Cannot create module spec for {main_file}")
+        print(f"   ✓ Imported: {main_file.name}\n")
     except Exception as e:
         print(f"   ✗ Failed to import {main_file}: {e}\n", file=sys.stderr)
         raise
@@ -84,31 +80,33 @@ def main():
         # Discover via main.py import
         models, operations = discover_via_main(main_path)
 
-        # Display discovered models
-        print(f"📦 Discovered Models ({len(models)}):")
+        # Display discovered models (one write per section)
+        parts: list[str] = [f"📦 Discovered Models ({len(models)}):\n"]
         if models:
             for model in models:
                 surfaces = model.get("surfaces", [])
                 surfaces_str = f" [{', '.join(surfaces)}]" if surfaces else ""
-                print(f"   ├─ {model.name}{surfaces_str}")
+                parts.append(f"   ├─ {model.name}{surfaces_str}\n")
                 if model.description:
-                    print(f"   │  └─ {model.description}")
+                    parts.append(f"   │  └─ {model.description}\n")
         else:
-            print("   └─ No models found\n")
+            parts.append("   └─ No models found\n\n")
+        sys.stdout.write("".join(parts))
 
         # Display discovered operations
-        print(f"\n🔧 Discovered Operations ({len(operations)}):")
+        parts = [f"\n🔧 Discovered Operations ({len(operations)}):\n"]
         if operations:
             for op in operations:
                 category = op.category if op.category else ""
                 category_str = f" ({category})" if category else ""
                 surfaces = op.get("surfaces", [])
                 surfaces_str = f" [{', '.join(surfaces)}]" if surfaces else ""
-                print(f"   ├─ {op.name}{category_str}{surfaces_str}")
+                parts.append(f"   ├─ {op.name}{category_str}{surfaces_str}\n")
                 if op.description:
-                    print(f"   │  └─ {op.description}")
+                    parts.append(f"   │  └─ {op.description}\n")
         else:
-            print("   └─ No operations found\n")
+            parts.append("   └─ No operations found\n\n")
+        sys.stdout.write("".join(parts))
 
         # Summary
         print(f"\n✅ Discovery complete!")
@@ -30,21 +30,159 @@ Output:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import os
+import py_compile
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path for imports
+# (core.* modules are imported inside the functions that use them so that
+# --help and argument errors do not pay the framework import cost)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.graph_generator import MermaidGraphGenerator
-from core.analysis.registries import ModelRegistry, OperationRegistry
 
+def _iter_module_files(directory: Path) -> list[os.DirEntry[str]]:
+    """List importable ``.py`` files in a directory (private modules skipped).
 
-def discover_and_register(project_dir: Path | None = None):
+    Args:
+        directory: Directory to scan (missing directories yield nothing)
+
+    Returns:
+        Directory entries for each module file
+    """
+    try:
+        with os.scandir(directory) as it:
+            # "_" prefix also covers __init__.py; name[0] is cheaper than startswith
+            return [entry for entry in it if entry.name[0] != "_" and entry.name.endswith(".py")]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _tree_signature(
+    project_dir: Path, scan_dirs: tuple[str, ...]
+) -> tuple[tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) of every module file scanned, used as a cache key.
+
+    Per-file sizes catch edits that keep the modification time (checkouts,
+    ``rsync -t``), which a directory mtime alone would miss.
+    """
+    signature = []
+    for scan_dir in scan_dirs:
+        for entry in _iter_module_files(project_dir / scan_dir):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _precompile(paths: list[str]) -> None:
+    """Write ``__pycache__`` bytecode for the given files in parallel.
+
+    Subsequent imports then load bytecode instead of compiling source.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda path: py_compile.compile(path, doraise=False), paths))
+
+
+def _import_project_modules(
+    project_dir: str,
+    scan_dirs: tuple[str, ...],
+    signature: tuple[tuple[str, int, int], ...],
+    parallel_compile: bool = False,
+) -> int:
+    """Import every module file under the scan directories.
+
+    Cached on the files' signatures so an unchanged tree is not re-imported
+    within the same process. A hit skips the imports, so it restores the
+    registrations recorded by the scan instead (e.g. after a caller cleared
+    the registries); registrations made since take precedence.
+
+    Returns:
+        Number of modules imported
+    """
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
+    imported_count, models, operations = _scan_and_import(
+        project_dir, scan_dirs, signature, parallel_compile
+    )
+    # Current registrations win over the recorded ones
+    ModelRegistry.restore({**models, **ModelRegistry.snapshot()})
+    OperationRegistry.restore({**operations, **OperationRegistry.snapshot()})
+    return imported_count
+
+
+@functools.lru_cache(maxsize=16)
+def _scan_and_import(
+    project_dir: str,
+    scan_dirs: tuple[str, ...],
+    signature: tuple[tuple[str, int, int], ...],
+    parallel_compile: bool = False,
+) -> tuple[int, dict, dict]:
+    """Execute every module file under the scan directories, once per signature.
+
+    Modules are re-executed even if already imported, so their decorators
+    register against the current registries and the snapshot is complete.
+
+    Returns:
+        Tuple of (modules imported, model snapshot, operation snapshot)
+    """
+    from core.analysis.discovery.import_scanner import cached_import
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
+    # models_dirs and ops_dirs often overlap in small projects: list each once
+    unique_dirs: dict[str, str] = {}
+    for scan_dir in scan_dirs:
+        unique_dirs.setdefault(os.path.realpath(os.path.join(project_dir, scan_dir)), scan_dir)
+
+    # Listing is I/O bound and releases the GIL, so directories are scanned
+    # concurrently; map() keeps results in scan order for deterministic imports
+    with ThreadPoolExecutor(max_workers=min(4, len(unique_dirs) or 1)) as executor:
+        listings = list(executor.map(_iter_module_files, map(Path, unique_dirs)))
+
+    module_files: list[tuple[str, os.DirEntry[str]]] = []
+    seen_realpaths: set[str] = set()
+
+    for scan_dir, entries in zip(unique_dirs.values(), listings, strict=True):
+        for entry in entries:
+            realpath = os.path.realpath(entry.path)
+            if realpath in seen_realpaths:
+                continue
+            seen_realpaths.add(realpath)
+            module_files.append((f"{scan_dir}.{entry.name[:-3]}", entry))
+
+    # Importing stays serial: decorators mutate the shared registries
+    if parallel_compile:
+        _precompile([entry.path for _, entry in module_files])
+
+    imported_count = 0
+    for module_name, entry in module_files:
+        # Drop any earlier import so cached_import executes the file again
+        sys.modules.pop(module_name, None)
+        try:
+            if cached_import(module_name, entry.path) is not None:
+                imported_count += 1
+        except Exception as e:
+            print(f"    ⚠ Could not import {entry.name}: {e}")
+    return imported_count, ModelRegistry.snapshot(), OperationRegistry.snapshot()
+
+
+def discover_and_register(
+    project_dir: Path | None = None,
+    use_cache: bool = True,
+    parallel_compile: bool = False,
+):
     """Auto-discover and import models and operations from project.
 
     Args:
         project_dir: Project directory to scan (default: current directory)
+        use_cache: Reuse the previous scan when the directories are unchanged
+        parallel_compile: Byte-compile all module files in parallel before importing
 
     Returns:
         Tuple of (models, operations) - already registered in registries
@@ -61,8 +199,6 @@ def discover_and_register(project_dir: Path | None = None):
         print(f"→ Found project config: {config_file}")
 
         try:
-            import importlib.util
-
             from core.config_manager import ConfigManager
 
             config_mgr = ConfigManager(config_file, project_root=project_dir)
@@ -76,42 +212,15 @@ def discover_and_register(project_dir: Path | None = None):
                 sys.path.insert(0, str(project_dir))
 
             # Import all Python files in these directories to trigger decorators
-            imported_count = 0
-            for models_dir in models_dirs:
-                model_path = project_dir / models_dir
-                if model_path.exists():
-                    for py_file in model_path.glob("*.py"):
-                        if py_file.name.startswith("_"):
-                            continue
-                        try:
-                            # Load module using importlib
-                            module_name = f"{models_dir}.{py_file.stem}"
-                            spec = importlib.util.spec_from_file_location(module_name, py_file)
-                            if spec and spec.loader:
-                                module = importlib.util.module_from_spec(spec)
-                                sys.modules[module_name] = module
-                                spec.loader.exec_module(module)
-                                imported_count += 1
-                        except Exception as e:
-                            print(f"    ⚠ Could not import {py_file.name}: {e}")
-
-            for ops_dir in ops_dirs:
-                ops_path = project_dir / ops_dir
-                if ops_path.exists():
-                    for py_file in ops_path.glob("*.py"):
-                        if py_file.name.startswith("_"):
-                            continue
-                        try:
-                            # Load module using importlib
-                            module_name = f"{ops_dir}.{py_file.stem}"
-                            spec = importlib.util.spec_from_file_location(module_name, py_file)
-                            if spec and spec.loader:
-                                module = importlib.util.module_from_spec(spec)
-                                sys.modules[module_name] = module
-                                spec.loader.exec_module(module)
-                                imported_count += 1
-                        except Exception as e:
-                            print(f"    ⚠ Could not import {py_file.name}: {e}")
+            scan_dirs = (*models_dirs, *ops_dirs)
+            if not use_cache:
+                _scan_and_import.cache_clear()
+            imported_count = _import_project_modules(
+                str(project_dir),
+                scan_dirs,
+                _tree_signature(project_dir, scan_dirs),
+                parallel_compile,
+            )
 
             print(f"  ✓ Imported {imported_count} modules")
 
@@ -122,6 +231,8 @@ def discover_and_register(project_dir: Path | None = None):
                 traceback.print_exc()
 
     # Return what's in the registries (after imports)
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
     models = ModelRegistry.list_all()
     operations = OperationRegistry.list_all()
 
@@ -130,11 +241,48 @@ def discover_and_register(project_dir: Path | None = None):
     return models, operations
 
 
+def _flow_signature(model_names: list[str], op_rows: list[tuple]) -> str:
+    """Hash of everything the operation flow diagram is rendered from."""
+    return hashlib.blake2b(repr((model_names, op_rows)).encode(), digest_size=16).hexdigest()
+
+
+def _relations_signature(models: list) -> str:
+    """Hash of everything the model relationships diagram is rendered from."""
+    data = []
+    for model in models:
+        fields = getattr(model.document_cls, "model_fields", {})
+        data.append(
+            (
+                model.name,
+                model.description,
+                [(name, str(info.annotation), info.description) for name, info in fields.items()],
+            )
+        )
+    return hashlib.blake2b(repr(data).encode(), digest_size=16).hexdigest()
+
+
+def _is_up_to_date(output_file: Path, signature: str) -> bool:
+    """Whether output_file was generated from inputs with this signature."""
+    sig_file = output_file.with_name(output_file.name + ".sig")
+    try:
+        return output_file.exists() and sig_file.read_text() == signature
+    except FileNotFoundError:
+        return False
+
+
+def _save_signature(output_file: Path, signature: str) -> None:
+    """Record the input signature next to a generated file."""
+    output_file.with_name(output_file.name + ".sig").write_text(signature)
+
+
 def generate_graphs(
     output_dir: Path,
     flow_only: bool = False,
     relations_only: bool = False,
     verbose: bool = False,
+    use_cache: bool = True,
+    models: list | None = None,
+    operations: list | None = None,
 ) -> tuple[Path | None, Path | None, Path | None]:
     """Generate Mermaid diagrams.
 
@@ -143,6 +291,9 @@ def generate_graphs(
         flow_only: Only generate operation flow
         relations_only: Only generate model relationships
         verbose: Print detailed information
+        use_cache: Skip diagrams whose inputs are unchanged since the last run
+        models: Registered models, as returned by discover_and_register()
+        operations: Registered operations, as returned by discover_and_register()
 
     Returns:
         Tuple of (flow_file, relations_file, index_file) or None if skipped
@@ -151,24 +302,32 @@ def generate_graphs(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get data from registries (after discovery)
-    models = ModelRegistry.list_all()
-    operations = OperationRegistry.list_all()
+    from core.graph_generator import MermaidGraphGenerator
+
+    # Fall back to the registries when discovery was skipped or failed
+    if models is None or operations is None:
+        from core.analysis.registries import ModelRegistry, OperationRegistry
+
+        models = ModelRegistry.list_all()
+        operations = OperationRegistry.list_all()
 
     if verbose:
-        print("\n📊 Registry State:")
-        print(f"   Models: {len(models)}")
-        print(f"   Operations: {len(operations)}")
+        lines = [
+            "",
+            "📊 Registry State:",
+            f"   Models: {len(models)}",
+            f"   Operations: {len(operations)}",
+        ]
 
         if models:
-            print("\n📦 Models:")
-            for model in models:
-                print(f"   - {model.name}: {model.document_cls.__name__}")
+            lines.extend(["", "📦 Models:"])
+            lines.extend(f"   - {model.name}: {model.document_cls.__name__}" for model in models)
 
         if operations:
-            print("\n⚙️  Operations:")
-            for op in operations:
-                print(f"   - {op.name} ({op.category}): {op.description}")
+            lines.extend(["", "⚙️  Operations:"])
+            lines.extend(f"   - {op.name} ({op.category}): {op.description}" for op in operations)
+
+        print("\n".join(lines))
 
     # Check if we have data
     if not models and not operations:
@@ -189,8 +348,16 @@ def generate_graphs(
     if not relations_only:
         print("  → Generating operation flow...")
         try:
-            flow_file = generator.generate_operation_flow(models, operations)
-            print(f"    ✓ Created {flow_file.name}")
+            model_names = [m.name for m in models]
+            op_rows = MermaidGraphGenerator.operation_rows(operations)
+            flow_sig = _flow_signature(model_names, op_rows)
+            flow_file = output_dir / "operation-flow.md"
+            if use_cache and _is_up_to_date(flow_file, flow_sig):
+                print(f"    ✓ {flow_file.name} is up to date")
+            else:
+                flow_file = generator.generate_operation_flow_from_rows(model_names, op_rows)
+                _save_signature(flow_file, flow_sig)
+                print(f"    ✓ Created {flow_file.name}")
 
             if verbose:
                 _print_file_preview(flow_file)
@@ -201,8 +368,14 @@ def generate_graphs(
     if not flow_only:
         print("  → Generating model relationships...")
         try:
-            relations_file = generator.generate_model_relationships(models)
-            print(f"    ✓ Created {relations_file.name}")
+            relations_sig = _relations_signature(models)
+            relations_file = output_dir / "model-relationships.md"
+            if use_cache and _is_up_to_date(relations_file, relations_sig):
+                print(f"    ✓ {relations_file.name} is up to date")
+            else:
+                relations_file = generator.generate_model_relationships(models)
+                _save_signature(relations_file, relations_sig)
+                print(f"    ✓ Created {relations_file.name}")
 
             if verbose:
                 _print_file_preview(relations_file)
@@ -233,13 +406,16 @@ def _print_file_preview(file_path: Path, max_lines: int = 15):
         max_lines: Maximum lines to show
     """
     try:
-        lines = file_path.read_text().splitlines()
+        # Only the head is kept in memory; the remainder is just counted
+        with open(file_path, encoding="utf-8") as f:
+            head = list(islice(f, max_lines))
+            remaining = sum(1 for _ in f)
         print(f"\n    Preview of {file_path.name}:")
         print("    " + "=" * 60)
-        for i, line in enumerate(lines[:max_lines]):
-            print(f"    {line}")
-        if len(lines) > max_lines:
-            print(f"    ... ({len(lines) - max_lines} more lines)")
+        for line in head:
+            print(f"    {line.rstrip()}")
+        if remaining:
+            print(f"    ... ({remaining} more lines)")
         print("    " + "=" * 60)
     except Exception as e:
         print(f"    (Could not preview: {e})")
@@ -343,6 +519,18 @@ Examples:
         help="Skip auto-discovery (use already registered models/operations)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan project directories and regenerate diagrams even if unchanged",
+    )
+
+    parser.add_argument(
+        "--parallel-compile",
+        action="store_true",
+        help="Byte-compile discovered modules in parallel before importing them",
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -355,9 +543,14 @@ Examples:
     print("=" * 70)
 
     # Discover models and operations
+    models = operations = None
     if not args.no_discover:
         try:
-            discover_and_register(args.project_dir)
+            models, operations = discover_and_register(
+                args.project_dir,
+                use_cache=not args.no_cache,
+                parallel_compile=args.parallel_compile,
+            )
         except Exception as e:
             print(f"⚠ Warning: Discovery failed: {e}")
             print("  Continuing with already registered models/operations...")
@@ -371,6 +564,9 @@ Examples:
             flow_only=args.flow_only,
             relations_only=args.relations_only,
             verbose=args.verbose,
+            use_cache=not args.no_cache,
+            models=models,
+            operations=operations,
         )
 
         # Print summary
@@ -9,14 +9,120 @@ Provides commands to:
 
 from __future__ import annotations
 
+import errno
+import functools
+import os
+import selectors
+import shutil
+import socket
+import struct
 import subprocess
 import sys
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any, TypeVar
 
 # Add parent to path for imports
+# (ConfigManager is imported in ServiceManager.__init__ so that printing usage
+# does not load the config stack)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.config_manager import ConfigManager
+T = TypeVar("T")
+
+# Every probe targets localhost, where a live service accepts almost at once
+PROBE_TIMEOUT = 0.2
+
+# How long docker, netlink and run_cache results are reused
+PROBE_CACHE_TTL = 2.0
+
+STATUS_UP = "✅ Up"
+STATUS_DOWN = "❌ Down"
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY}
+
+# Where supported (Linux), probe sockets are created non-blocking by socket()
+# itself; a connected TCP socket cannot be reused, so creation is the only
+# per-probe cost worth trimming
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+_NONBLOCKING_STREAM = socket.SOCK_STREAM | _SOCK_NONBLOCK
+
+# Netlink sock_diag constants (linux/netlink.h, linux/sock_diag.h, linux/tcp.h)
+_NETLINK_SOCK_DIAG = 4
+_SOCK_DIAG_BY_FAMILY = 20
+_NLM_F_REQUEST = 0x1
+_NLM_F_DUMP = 0x300
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_NLMSG_HDRLEN = 16
+_TCP_LISTEN = 10
+
+# Listener addresses that accept the fallback probe's connect to 127.0.0.1:
+# loopback itself, the wildcard, and their IPv6 (dual-stack) forms
+_PROBED_LISTEN_ADDRESSES = {
+    socket.AF_INET: {socket.inet_aton("0.0.0.0"), socket.inet_aton("127.0.0.1")},
+    socket.AF_INET6: {
+        socket.inet_pton(socket.AF_INET6, "::"),
+        socket.inet_pton(socket.AF_INET6, "::ffff:127.0.0.1"),
+    },
+}
+
+
+# Results of expensive probes, keyed on (function name, args): (timestamp, value)
+_probe_cache: dict[tuple, tuple[float, Any]] = {}
+
+
+def _ttl_cache(seconds: float) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Memoize a probe for a few seconds.
+
+    Repeated health checks (e.g. a polling dashboard) then reuse the last
+    docker/netlink/filesystem answer instead of asking again each time.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> T:
+            key = (func.__qualname__, *args)
+            now = time.monotonic()
+            cached = _probe_cache.get(key)
+            if cached is not None and now - cached[0] <= seconds:
+                return cached[1]
+            value = func(*args)
+            _probe_cache[key] = (now, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _read_diag_ports(sock: socket.socket, ports: set[int]) -> bool:
+    """Collect ports listening on loopback or the wildcard from a sock_diag dump.
+
+    Reads until NLMSG_DONE. Listeners bound to other addresses are skipped, so
+    the result matches what connecting to 127.0.0.1 would find.
+
+    Returns:
+        False if the kernel answered with an error
+    """
+    while True:
+        data = sock.recv(65536)
+        offset = 0
+        while offset + _NLMSG_HDRLEN <= len(data):
+            length, msg_type = struct.unpack_from("=LH", data, offset)
+            if msg_type == _NLMSG_DONE:
+                return True
+            if msg_type == _NLMSG_ERROR or length < _NLMSG_HDRLEN:
+                return False
+            # inet_diag_msg: family, state, timer, retrans, then inet_diag_sockid:
+            # idiag_sport, idiag_dport (big-endian), idiag_src (16 bytes)
+            msg = offset + _NLMSG_HDRLEN
+            family = data[msg]
+            address_size = 4 if family == socket.AF_INET else 16
+            address = data[msg + 8:msg + 8 + address_size]
+            if address in _PROBED_LISTEN_ADDRESSES.get(family, ()):
+                ports.add(struct.unpack_from("!H", data, msg + 4)[0])
+            offset += (length + 3) & ~3
 
 
 class ServiceManager:
@@ -30,6 +136,9 @@ class ServiceManager:
         "prefect_ui": "Prefect UI",
     }
 
+    # Resolved once: without docker installed, container checks are skipped
+    _docker_bin = shutil.which("docker")
+
     def __init__(self, config_path: Path | str | None = None):
         """Initialize service manager.
 
@@ -37,11 +146,16 @@ class ServiceManager:
             config_path: Path to .jobhunter.yml
         """
         try:
+            from core.config_manager import ConfigManager
+
             self.config = ConfigManager(config_path)
             self.config.load()
         except Exception:
             self.config = None
 
+        # Resolved once; every command reads ports from here
+        self._ports = self._configured_ports() if self.config else {}
+
     def where(self, service: str) -> None:
         """Show where a service is running.
 
@@ -53,7 +167,7 @@ class ServiceManager:
             return
 
         try:
-            port = self.config.get_port(service)
+            port = self._port(service)
             service_display = self.SERVICE_NAMES.get(service, service)
 
             print()
@@ -82,34 +196,49 @@ class ServiceManager:
         print("📊 All Services:")
         print()
 
-        # Build table data
-        services_data = []
-        for service_key, service_name in self.SERVICE_NAMES.items():
-            try:
-                port = self.config.get_port(service_key)
-                url = f"http://localhost:{port}"
-                is_up = self._is_port_listening(port)
-                status = "✅ Up" if is_up else "❌ Down"
-
-                services_data.append({
-                    "name": service_name,
-                    "port": str(port),
-                    "url": url,
-                    "status": status,
-                })
-            except ValueError:
-                pass
-
-        # Print table
-        if services_data:
-            self._print_table(
-                ["Service", "Port", "URL", "Status"],
-                [[d["name"], d["port"], d["url"], d["status"]] for d in services_data],
-            )
-        else:
+        ports = self._ports
+        if not ports:
             print("❌ No services configured")
+            print()
+            return
 
-        print()
+        # Everything but the status is known up front, so the header goes out
+        # before probing and each row as soon as its port (and every port
+        # above it) has answered
+        headers = ["Service", "Port", "URL", "Status"]
+        service_ports = list(ports.values())
+        rows = [
+            [self.SERVICE_NAMES[service_key], str(port), f"http://localhost:{port}"]
+            for service_key, port in ports.items()
+        ]
+        widths = self._table_widths(headers, [[*row, STATUS_DOWN] for row in rows])
+
+        def row_line(i: int) -> str:
+            status = STATUS_UP if states.get(service_ports[i]) else STATUS_DOWN
+            return self._table_row([*rows[i], status], widths)
+
+        self._write_lines([
+            self._table_rule(widths, "┌", "┬", "┐"),
+            self._table_row(headers, widths),
+            self._table_rule(widths, "├", "┼", "┤"),
+        ])
+
+        states: dict[int, bool] = {}
+        written = 0
+        for port, is_up in self._iter_probe_ports(list(dict.fromkeys(service_ports))):
+            states[port] = is_up
+            ready = []
+            while written < len(rows) and service_ports[written] in states:
+                ready.append(row_line(written))
+                written += 1
+            if ready:
+                self._write_lines(ready)
+
+        # Ports the probe gave up on are reported down
+        self._write_lines(
+            [row_line(i) for i in range(written, len(rows))]
+            + [self._table_rule(widths, "└", "┴", "┘"), ""]
+        )
 
     def is_up(self, service: str) -> int:
         """Check if a service is up.
@@ -125,7 +254,7 @@ class ServiceManager:
             return 1
 
         try:
-            port = self.config.get_port(service)
+            port = self._port(service)
             service_display = self.SERVICE_NAMES.get(service, service)
 
             if self._is_port_listening(port):
@@ -150,118 +279,261 @@ class ServiceManager:
 
         issues = []
         warnings = []
+        # Each section is written in one go once its checks have run
+        out: list[str] = []
 
-        print()
-        print("🏥 System Health Check:")
-        print()
+        out.extend(["", "🏥 System Health Check:", ""])
 
         # Check Configuration
-        print("━" * 50)
-        print("📋 CONFIGURATION")
-        print("━" * 50)
+        out.extend(["━" * 50, "📋 CONFIGURATION", "━" * 50])
 
         config_issues = self.config.check_corruption()
         if config_issues:
             for issue in config_issues:
-                print(f"  ❌ {issue}")
+                out.append(f"  ❌ {issue}")
                 issues.append(issue)
         else:
-            print(f"  ✅ {self.config.config_path}: Valid")
+            out.append(f"  ✅ {self.config.config_path}: Valid")
+
+        # One directory listing answers every existence check below
+        project_entries = self._list_dir(self.config.project_root)
 
         # Check Makefile
-        makefile_path = self.config.project_root / "Makefile"
-        if makefile_path.exists():
-            print("  ✅ Makefile: Exists")
+        if "Makefile" in project_entries:
+            out.append("  ✅ Makefile: Exists")
         else:
-            print("  ⚠️  Makefile: Missing (run 'make setup')")
+            out.append("  ⚠️  Makefile: Missing (run 'make setup')")
             warnings.append("Makefile missing")
 
         # Check docker-compose
-        docker_compose_path = self.config.project_root / "docker-compose.yml"
-        if docker_compose_path.exists():
-            print("  ✅ docker-compose.yml: Exists")
+        if "docker-compose.yml" in project_entries:
+            out.append("  ✅ docker-compose.yml: Exists")
         else:
-            print("  ⚠️  docker-compose.yml: Missing")
+            out.append("  ⚠️  docker-compose.yml: Missing")
             warnings.append("docker-compose.yml missing")
 
         # Check run_cache
-        run_cache_path = self.config.project_root / "run_cache"
-        if run_cache_path.exists():
-            print("  ✅ run_cache/: Exists")
+        if "run_cache" in project_entries:
+            out.append("  ✅ run_cache/: Exists")
             # Check for generated files
-            if (run_cache_path / "generated_api.py").exists():
-                print("     ✅ generated_api.py: Present")
+            if "generated_api.py" in self._list_dir(self.config.project_root / "run_cache"):
+                out.append("     ✅ generated_api.py: Present")
             else:
-                print("     ⚠️  generated_api.py: Missing (run 'make compile')")
+                out.append("     ⚠️  generated_api.py: Missing (run 'make compile')")
                 warnings.append("generated_api.py missing")
         else:
-            print("  ⚠️  run_cache/: Missing (run 'make compile')")
+            out.append("  ⚠️  run_cache/: Missing (run 'make compile')")
             warnings.append("run_cache missing")
 
-        print()
+        out.append("")
+        self._write_lines(out)
 
         # Check Docker Containers
-        print("━" * 50)
-        print("🐳 DOCKER CONTAINERS")
-        print("━" * 50)
+        out.extend(["━" * 50, "🐳 DOCKER CONTAINERS", "━" * 50])
 
         container_status = self._check_containers()
         if container_status:
             for container, status in container_status.items():
                 symbol = "✅" if status["healthy"] else "⚠️ " if status["restarting"] else "❌"
-                print(f"  {symbol} {container}: {status['message']}")
+                out.append(f"  {symbol} {container}: {status['message']}")
                 if not status["healthy"] and not status["restarting"]:
                     issues.append(f"Container {container} not healthy")
         else:
-            print("  ℹ️  No containers running")
+            out.append("  ℹ️  No containers running")
 
-        print()
+        out.append("")
+        self._write_lines(out)
 
         # Check Services
-        print("━" * 50)
-        print("🔌 SERVICES")
-        print("━" * 50)
-
-        for service_key, service_name in self.SERVICE_NAMES.items():
-            try:
-                port = self.config.get_port(service_key)
-                if self._is_port_listening(port):
-                    print(f"  ✅ {service_name} ({port}): Up")
-                else:
-                    print(f"  ❌ {service_name} ({port}): Down")
-                    issues.append(f"{service_name} not responding")
-            except ValueError:
-                pass
+        out.extend(["━" * 50, "🔌 SERVICES", "━" * 50])
+
+        ports = self._ports
+        listening = self._probe_ports(list(ports.values()))
+        for service_key, port in ports.items():
+            service_name = self.SERVICE_NAMES[service_key]
+            if listening[port]:
+                out.append(f"  ✅ {service_name} ({port}): Up")
+            else:
+                out.append(f"  ❌ {service_name} ({port}): Down")
+                issues.append(f"{service_name} not responding")
 
-        print()
+        out.append("")
+        self._write_lines(out)
 
         # Check run_cache integrity
-        print("━" * 50)
-        print("💾 RUN CACHE")
-        print("━" * 50)
+        out.extend(["━" * 50, "💾 RUN CACHE", "━" * 50])
 
         cache_status = self._check_run_cache()
         if cache_status:
             for item, status in cache_status.items():
                 symbol = "✅" if status["valid"] else "❌"
-                print(f"  {symbol} {item}: {status['message']}")
+                out.append(f"  {symbol} {item}: {status['message']}")
                 if not status["valid"]:
                     issues.append(f"{item} corrupted or invalid")
         else:
-            print("  ⚠️  run_cache/ not found")
+            out.append("  ⚠️  run_cache/ not found")
 
-        print()
+        out.append("")
 
         # Summary
-        print("━" * 50)
+        out.append("━" * 50)
         if not issues:
-            print("✅ Overall Status: Healthy")
-            return 0
+            out.append("✅ Overall Status: Healthy")
         else:
-            print(f"⚠️  Overall Status: {len(issues)} issue(s) found")
-            for i, issue in enumerate(issues, 1):
-                print(f"   {i}. {issue}")
-            return 1
+            out.append(f"⚠️  Overall Status: {len(issues)} issue(s) found")
+            out.extend(f"   {i}. {issue}" for i, issue in enumerate(issues, 1))
+        self._write_lines(out)
+        return 0 if not issues else 1
+
+    def _port(self, service: str) -> int:
+        """Port for a service, from the resolved mapping when possible.
+
+        Raises:
+            ValueError: If service not found in config
+        """
+        port = self._ports.get(service)
+        return port if port is not None else self.config.get_port(service)
+
+    def _configured_ports(self) -> dict[str, int]:
+        """Map each known service to its configured port.
+
+        Returns:
+            Dict of service key to port (unconfigured services omitted)
+        """
+        ports = {}
+        for service_key in self.SERVICE_NAMES:
+            try:
+                ports[service_key] = self.config.get_port(service_key)
+            except ValueError:
+                pass
+        return ports
+
+    @staticmethod
+    def _probe_ports(ports: list[int], timeout: float = PROBE_TIMEOUT) -> dict[int, bool]:
+        """Check several ports with one shared deadline.
+
+        Args:
+            ports: Port numbers
+            timeout: Seconds to wait for all connections
+
+        Returns:
+            Dict of port to listening state
+        """
+        listening = dict.fromkeys(ports, False)
+        listening.update(ServiceManager._iter_probe_ports(list(listening), timeout))
+        return listening
+
+    @staticmethod
+    def _iter_probe_ports(
+        ports: list[int], timeout: float = PROBE_TIMEOUT
+    ) -> Iterator[tuple[int, bool]]:
+        """Yield (port, listening) pairs as each port's state becomes known.
+
+        All connects are started non-blocking and awaited together on one
+        selector (epoll/kqueue where available), so the total wait is bounded
+        by ``timeout`` however many ports are down. Ports without an answer by
+        then are yielded as down.
+
+        Args:
+            ports: Distinct port numbers
+            timeout: Seconds to wait for all connections
+
+        Yields:
+            Port and whether it is listening, in completion order
+        """
+        listeners = ServiceManager._listening_ports_netlink()
+        if listeners is not None:
+            for port in ports:
+                yield port, port in listeners
+            return
+
+        pending: dict[socket.socket, int] = {}
+        with selectors.DefaultSelector() as selector:
+            try:
+                for port in ports:
+                    try:
+                        sock = socket.socket(socket.AF_INET, _NONBLOCKING_STREAM)
+                    except OSError:
+                        yield port, False
+                        continue
+                    if not _SOCK_NONBLOCK:
+                        sock.setblocking(False)
+                    result = sock.connect_ex(("127.0.0.1", port))
+                    if result in _CONNECT_IN_PROGRESS:
+                        pending[sock] = port
+                        selector.register(sock, selectors.EVENT_WRITE)
+                    else:
+                        sock.close()
+                        yield port, result == 0
+
+                deadline = time.monotonic() + timeout
+                while pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        events = selector.select(remaining)
+                    except OSError:
+                        break
+                    if not events:
+                        break
+                    for key, _ in events:
+                        # Writable means the connect finished; SO_ERROR says how
+                        sock = key.fileobj
+                        selector.unregister(sock)
+                        port = pending.pop(sock)
+                        is_up = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                        sock.close()
+                        yield port, is_up
+
+                unanswered = list(pending.values())
+            finally:
+                for sock in pending:
+                    sock.close()
+                pending.clear()
+
+        for port in unanswered:
+            yield port, False
+
+    @staticmethod
+    @_ttl_cache(PROBE_CACHE_TTL)
+    def _listening_ports_netlink() -> set[int] | None:
+        """List TCP ports listening on 127.0.0.1 via one sock_diag dump.
+
+        This is the query ``ss -tln`` makes: the kernel returns its whole
+        listener table, so no connection is attempted at all. Only listeners
+        on loopback or the wildcard address count, as for the connect probe.
+
+        Returns:
+            Listening ports, or None when netlink is unavailable (non-Linux,
+            restricted sandbox), in which case callers fall back to connecting
+        """
+        if not hasattr(socket, "AF_NETLINK"):
+            return None
+
+        ports: set[int] = set()
+        try:
+            with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, _NETLINK_SOCK_DIAG) as sock:
+                for family in (socket.AF_INET, socket.AF_INET6):
+                    # inet_diag_req_v2 with an all-zero inet_diag_sockid
+                    request = struct.pack(
+                        "=BBBxI48x", family, socket.IPPROTO_TCP, 0, 1 << _TCP_LISTEN
+                    )
+                    header = struct.pack(
+                        "=LHHLL",
+                        _NLMSG_HDRLEN + len(request),
+                        _SOCK_DIAG_BY_FAMILY,
+                        _NLM_F_REQUEST | _NLM_F_DUMP,
+                        family,
+                        0,
+                    )
+                    sock.send(header + request)
+                    if not _read_diag_ports(sock, ports):
+                        return None
+        except OSError:
+            return None
+
+        return ports
 
     @staticmethod
     def _is_port_listening(port: int) -> bool:
@@ -273,51 +545,51 @@ class ServiceManager:
         Returns:
             True if port is listening
         """
-        try:
-            import socket
-
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(("127.0.0.1", port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
+        return ServiceManager._probe_ports([port])[port]
 
     @staticmethod
+    @_ttl_cache(PROBE_CACHE_TTL)
     def _check_containers() -> dict[str, dict]:
         """Check Docker container status.
 
         Returns:
             Dict of container statuses
         """
+        docker = ServiceManager._docker_bin
+        if docker is None:
+            return {}
+
         try:
             result = subprocess.run(
-                ["docker", "ps", "-a", "--format", "{{.Names}}\t{{.Status}}"],
+                # The daemon does the (substring) name match, so unrelated
+                # containers are never listed
+                [
+                    docker, "ps", "-a",
+                    "--filter", "name=jobhunter",
+                    "--format", "{{.Names}}\t{{.Status}}",
+                ],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
 
+            # Split the raw bytes and decode only the name/status pairs kept
             containers = {}
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                parts = line.split("\t")
+            for line in result.stdout.split(b"\n"):
+                parts = line.split(b"\t")
                 if len(parts) == 2:
-                    name, status = parts
-                    if "jobhunter" in name:
-                        containers[name] = {
-                            "healthy": "Up" in status and "Healthy" in status,
-                            "restarting": "Restarting" in status,
-                            "message": status,
-                        }
+                    name, status = (part.decode("utf-8", "replace").strip() for part in parts)
+                    containers[name] = {
+                        "healthy": "Up" in status and "Healthy" in status,
+                        "restarting": "Restarting" in status,
+                        "message": status,
+                    }
 
             return containers
         except Exception:
             return {}
 
     @staticmethod
+    @_ttl_cache(PROBE_CACHE_TTL)
     def _check_run_cache() -> dict[str, dict]:
         """Check run_cache/ integrity.
 
@@ -325,21 +597,26 @@ class ServiceManager:
             Dict of cache item statuses
         """
         cache_dir = Path("run_cache")
-        if not cache_dir.exists():
+        cache_entries = ServiceManager._list_dir(cache_dir)
+        if not cache_entries and not cache_dir.is_dir():
             return {}
+        cli_entries = ServiceManager._list_dir(cache_dir / "cli") if "cli" in cache_entries else {}
 
         items = {
-            "generated_api.py": cache_dir / "generated_api.py",
-            "generated_frontend/": cache_dir / "generated_frontend",
-            "cli/jobhunter": cache_dir / "cli" / "jobhunter",
+            "generated_api.py": cache_entries.get("generated_api.py"),
+            "generated_frontend/": cache_entries.get("generated_frontend"),
+            "cli/jobhunter": cli_entries.get("jobhunter"),
         }
 
         status = {}
-        for name, path in items.items():
-            if path.exists():
+        for name, entry in items.items():
+            if entry is not None:
+                # is_file() comes from the directory listing itself; stat() is
+                # the only syscall per item and only runs for regular files
+                executable = entry.is_file() and bool(entry.stat().st_mode & 0o111)
                 status[name] = {
                     "valid": True,
-                    "message": f"Present ({'executable' if path.is_file() and path.stat().st_mode & 0o111 else 'readable'})",
+                    "message": f"Present ({'executable' if executable else 'readable'})",
                 }
             else:
                 status[name] = {
@@ -350,37 +627,51 @@ class ServiceManager:
         return status
 
     @staticmethod
-    def _print_table(headers: list[str], rows: list[list[str]]) -> None:
-        """Print formatted table.
+    def _list_dir(directory: Path) -> dict[str, os.DirEntry[str]]:
+        """List a directory's entries by name in one scandir call.
+
+        Args:
+            directory: Directory to list (missing directories yield nothing)
+
+        Returns:
+            Dict of entry name to directory entry
+        """
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    @staticmethod
+    def _write_lines(lines: list[str]) -> None:
+        """Write lines to stdout in a single call, then empty the list.
 
         Args:
-            headers: Column headers
-            rows: Table rows
+            lines: Lines to write (without trailing newlines)
         """
-        # Calculate column widths
-        widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                widths[i] = max(widths[i], len(str(cell)))
-
-        # Print header
-        header_line = "┌" + "┬".join("─" * (w + 2) for w in widths) + "┐"
-        print(header_line)
-
-        header = "│" + "│".join(f" {h:<{w}} " for h, w in zip(headers, widths, strict=False)) + "│"
-        print(header)
-
-        sep_line = "├" + "┼".join("─" * (w + 2) for w in widths) + "┤"
-        print(sep_line)
-
-        # Print rows
-        for row in rows:
-            row_line = "│" + "│".join(f" {cell:<{w}} " for cell, w in zip(row, widths, strict=False)) + "│"
-            print(row_line)
-
-        # Print footer
-        footer_line = "└" + "┴".join("─" * (w + 2) for w in widths) + "┘"
-        print(footer_line)
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+    @staticmethod
+    def _table_widths(headers: list[str], rows: list[list[str]]) -> list[int]:
+        """Width of each column: its longest header or cell."""
+        # zip(*rows) transposes rows into columns
+        columns = list(zip(*rows, strict=True)) if rows else [()] * len(headers)
+        return [
+            max(len(h), *map(len, map(str, column))) if column else len(h)
+            for h, column in zip(headers, columns, strict=False)
+        ]
+
+    @staticmethod
+    def _table_rule(widths: list[int], left: str, middle: str, right: str) -> str:
+        """Horizontal table border using the given corner/junction characters."""
+        return left + middle.join("─" * (w + 2) for w in widths) + right
+
+    @staticmethod
+    def _table_row(cells: list[str], widths: list[int]) -> str:
+        """Table row with each cell left-aligned to its column width."""
+        padded = (" " + str(cell).ljust(w) + " " for cell, w in zip(cells, widths, strict=False))
+        return "│" + "│".join(padded) + "│"
 
 
 def main():
@@ -12,9 +12,11 @@ Application-specific test fixtures should be defined in application tests.
 """
 
 import asyncio
+import importlib
 import sys
 import shutil
-from collections.abc import AsyncGenerator
+import tarfile
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -25,9 +27,49 @@ import pytest
 # from mongomock_motor import AsyncMongoMockClient
 
 # Add parent directory to path so tests can import core modules
-FRAMEWORK_ROOT = Path(__file__).parent.parent
+FRAMEWORK_ROOT = Path(__file__).resolve().parents[1]
+FIXTURES_DIR = FRAMEWORK_ROOT / "tests" / "fixtures"
 sys.path.insert(0, str(FRAMEWORK_ROOT))
 
+# Sample inputs shared by the data fixtures below (immutable, so one object per session)
+SAMPLE_MARKDOWN_TASKS = """
+# My Tasks
+
+- [ ] Buy groceries
+- [x] Complete report
+- [ ] Review pull request
+- [x] Update documentation
+- [ ] Fix bug in authentication
+"""
+
+SAMPLE_JSON_TASKS = """[
+    {
+        "title": "Task 1",
+        "description": "First task",
+        "importance_rate": 4,
+        "status": "pending"
+    },
+    {
+        "title": "Task 2",
+        "description": "Second task",
+        "importance_rate": 2,
+        "status": "in_progress"
+    }
+]"""
+
+SAMPLE_CODE_WITH_TODOS = """
+def process_data(data):
+    # TODO: Add validation for input data
+    result = []
+    for item in data:
+        # FIXME: This fails for empty items
+        result.append(item.upper())
+    return result
+
+# TODO: Implement error handling
+# FIXME: Memory leak in batch processing
+"""
+
 
 # Async event loop fixture
 @pytest.fixture(scope="session")
@@ -74,65 +116,100 @@ def framework_root() -> Path:
 @pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Get fixtures directory path."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
 
 
-@pytest.fixture(scope="session")
-def todo_app_path(tmp_path_factory) -> Path:
-    """Extract todo-app to temporary directory for testing.
+TODO_APP_TARBALL = FRAMEWORK_ROOT / "examples" / "todo-app.tar.gz"
+# Part of the extraction cache key: bump whenever _todo_app_member_filter changes
+# so runs never reuse a tree extracted with different rules
+TODO_APP_FILTER_VERSION = 2
 
-    This fixture:
-    1. Extracts examples/todo-app.tar.gz to temp location
-    2. Returns path to extracted directory
-    3. Cleans up after session
-    """
-    # Create temp directory for this session
-    temp_dir = tmp_path_factory.mktemp("todo-app-test")
+# Build and VCS artefacts in examples/todo-app.tar.gz that no test reads
+TODO_APP_EXCLUDED_DIRS = {".git", ".venv", "__pycache__", "node_modules"}
+TODO_APP_EXCLUDED_SUFFIXES = {".pyc", ".pyo"}
+
+# Extraction filters landed in Python 3.11.4; older 3.11 releases lack them
+_TAR_DATA_FILTER = getattr(tarfile, "data_filter", None)
 
-    # Extract todo-app
-    import tarfile
-    tar_path = FRAMEWORK_ROOT / "examples" / "todo-app.tar.gz"
 
-    if tar_path.exists():
-        with tarfile.open(tar_path, "r:gz") as tar:
-            tar.extractall(temp_dir)
+def _todo_app_member_filter(member: tarfile.TarInfo, path: str) -> tarfile.TarInfo | None:
+    """Skip artefacts outside todo-app, with tarfile's safe "data" checks if available."""
+    parts = Path(member.name).parts
+    if not parts or parts[0] != "todo-app":
+        return None
+    if TODO_APP_EXCLUDED_DIRS.intersection(parts):
+        return None
+    if Path(member.name).suffix in TODO_APP_EXCLUDED_SUFFIXES:
+        return None
+    return _TAR_DATA_FILTER(member, path) if _TAR_DATA_FILTER else member
 
-        # Return path to extracted todo-app
-        extracted_path = temp_dir / "todo-app"
-        if extracted_path.exists():
-            return extracted_path
 
-    # If extraction failed, create empty dir
-    empty_dir = temp_dir / "todo-app"
-    empty_dir.mkdir(exist_ok=True)
-    return empty_dir
+@pytest.fixture(scope="session")
+def todo_app_path() -> Path:
+    """Extract todo-app once into a cache shared by all test sessions.
+
+    This fixture:
+    1. Extracts examples/todo-app.tar.gz into the system temp directory,
+       keyed on the filter version and the tarball's size and mtime
+    2. Reuses an earlier extraction of the same tarball (e.g. from another
+       pytest-xdist worker or a previous run)
+    3. Returns path to extracted directory, or skips the test when the
+       tarball is missing
+    """
+    tar_path = TODO_APP_TARBALL
+    if not tar_path.exists():
+        pytest.skip(f"{tar_path.relative_to(FRAMEWORK_ROOT)} not found")
+
+    stat = tar_path.stat()
+    cache_dir = Path(tempfile.gettempdir()) / (
+        f"pulpo-todoapp-v{TODO_APP_FILTER_VERSION}-{stat.st_size}-{stat.st_mtime_ns}"
+    )
+    extracted_path = cache_dir / "todo-app"
+    if extracted_path.exists():
+        return extracted_path
+
+    # Extract next to the cache entry, then rename it into place: rename is
+    # atomic, so concurrent workers never see a half-extracted tree and the
+    # loser of a race simply discards its copy
+    staging_dir = Path(tempfile.mkdtemp(prefix=f"{cache_dir.name}-", dir=cache_dir.parent))
+    with tarfile.open(tar_path, "r|gz") as tar:
+        if _TAR_DATA_FILTER:
+            tar.extractall(staging_dir, filter=_todo_app_member_filter)
+        else:
+            members = (m for m in tar if _todo_app_member_filter(m, str(staging_dir)))
+            tar.extractall(staging_dir, members=members)
+    (staging_dir / "todo-app").mkdir(exist_ok=True)
+
+    try:
+        staging_dir.rename(cache_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    return extracted_path
 
 
 @pytest.fixture
-def temp_project_dir(tmp_path) -> AsyncGenerator[Path, None]:
+def temp_project_dir(tmp_path) -> Path:
     """Create temporary project directory for tests.
 
-    Yields:
+    Returns:
         Path to temporary project directory
 
     Cleanup:
-        Removes directory after test
+        Left to pytest's tmp_path retention (only the last few runs are kept)
     """
     project_dir = tmp_path / "test_project"
     project_dir.mkdir(parents=True, exist_ok=True)
+    return project_dir
 
-    yield project_dir
-
-    # Cleanup
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
 
+@pytest.fixture
+def clean_registries():
+    """Reset model and operation registries around a test.
 
-@pytest.fixture(autouse=True)
-def reset_registries():
-    """Reset model and operation registries before each test.
-
-    This ensures test isolation - each test starts with clean registries.
+    Applied automatically to tests marked ``registries`` (see
+    pytest_collection_modifyitems), so tests that never touch the registries
+    skip the setup entirely.
     """
     from core.analysis.registries import ModelRegistry, OperationRegistry
 
@@ -147,18 +224,76 @@ def reset_registries():
     OperationRegistry.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_models_module() -> str:
     """Get import path to sample models fixture."""
     return "tests.fixtures.sample_models"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_operations_module() -> str:
     """Get import path to sample operations fixture."""
     return "tests.fixtures.sample_operations"
 
 
+@pytest.fixture(scope="session")
+def imported_fixtures(sample_models_module, sample_operations_module) -> tuple[dict, dict]:
+    """Import the sample models and operations once per session.
+
+    Returns:
+        (models, operations) registry snapshots taken right after import
+    """
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
+    ModelRegistry.clear()
+    OperationRegistry.clear()
+    for module_name in (sample_models_module, sample_operations_module):
+        # Decorators only run on first import, and reloading would rebind the
+        # Document classes other modules already hold: tests must reach the
+        # samples through this fixture so this import is the one recorded
+        if module_name in sys.modules:
+            raise RuntimeError(
+                f"{module_name} was imported before imported_fixtures; "
+                "use the sample_registries fixture instead"
+            )
+        importlib.import_module(module_name)
+
+    snapshot = (ModelRegistry.snapshot(), OperationRegistry.snapshot())
+    ModelRegistry.clear()
+    OperationRegistry.clear()
+    return snapshot
+
+
+@pytest.fixture
+def sample_registries(imported_fixtures, clean_registries):
+    """Populate the registries with the sample models and operations.
+
+    Restores the session snapshot instead of re-importing the fixture modules.
+    """
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
+    models, operations = imported_fixtures
+    ModelRegistry.restore(models)
+    OperationRegistry.restore(operations)
+
+
+@pytest.fixture(scope="session")
+def sample_graph(imported_fixtures):
+    """Graph built once from the sample registries (treat as read-only)."""
+    from core.analysis.graph_builder import build_graph_from_registries
+    from core.analysis.registries import ModelRegistry, OperationRegistry
+
+    saved = (ModelRegistry.snapshot(), OperationRegistry.snapshot())
+    models, operations = imported_fixtures
+    ModelRegistry.restore(models)
+    OperationRegistry.restore(operations)
+    try:
+        return build_graph_from_registries("todo-app-test")
+    finally:
+        ModelRegistry.restore(saved[0])
+        OperationRegistry.restore(saved[1])
+
+
 @pytest.fixture
 def mock_model_metadata() -> dict:
     """Mock metadata for a simple model.
@@ -205,54 +340,22 @@ def mock_operation_metadata() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_markdown_tasks() -> str:
     """Sample Markdown with checkboxes for testing loaders."""
-    return """
-# My Tasks
+    return SAMPLE_MARKDOWN_TASKS
 
-- [ ] Buy groceries
-- [x] Complete report
-- [ ] Review pull request
-- [x] Update documentation
-- [ ] Fix bug in authentication
-"""
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_tasks() -> str:
     """Sample JSON tasks for testing loaders."""
-    return """[
-    {
-        "title": "Task 1",
-        "description": "First task",
-        "importance_rate": 4,
-        "status": "pending"
-    },
-    {
-        "title": "Task 2",
-        "description": "Second task",
-        "importance_rate": 2,
-        "status": "in_progress"
-    }
-]"""
+    return SAMPLE_JSON_TASKS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_code_with_todos() -> str:
     """Sample code with TODO/FIXME comments."""
-    return """
-def process_data(data):
-    # TODO: Add validation for input data
-    result = []
-    for item in data:
-        # FIXME: This fails for empty items
-        result.append(item.upper())
-    return result
-
-# TODO: Implement error handling
-# FIXME: Memory leak in batch processing
-"""
+    return SAMPLE_CODE_WITH_TODOS
 
 
 # Pytest configuration
@@ -270,3 +373,26 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "requires_todo_app: Tests that require todo-app fixture"
     )
+    config.addinivalue_line(
+        "markers", "registries: Tests that start and end with clean registries"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): Run with pytest-xdist --dist loadgroup on one worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Request clean_registries for every test marked ``registries``.
+
+    Tests marked ``requires_todo_app`` are skipped up front when the todo-app
+    tarball is missing (checked once per session rather than per test).
+    """
+    skip_todo_app = None
+    if not TODO_APP_TARBALL.exists():
+        skip_todo_app = pytest.mark.skip(reason=f"{TODO_APP_TARBALL.name} not found")
+
+    for item in items:
+        if item.get_closest_marker("registries") and "clean_registries" not in item.fixturenames:
+            item.fixturenames.insert(0, "clean_registries")
+        if skip_todo_app and item.get_closest_marker("requires_todo_app"):
+            item.add_marker(skip_todo_app)
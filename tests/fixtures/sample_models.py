@@ -44,6 +44,14 @@ class DateRange(BaseModel):
             return False
         return datetime.utcnow() > self.finish
 
+    def urgency(self) -> float:
+        """Urgency score 0-10 implied by the finish date."""
+        if self.finish is None:
+            return 0.5
+        if self.is_overdue():
+            return 10.0
+        return 5.0
+
 
 # Enum for status
 class TaskStatusEnum(str, Enum):
@@ -99,7 +107,8 @@ class Task(Document):
     )
     subtasks: list[BackLink["Task"]] = Field(
         default=[],
-        description="Subtasks"
+        description="Subtasks",
+        json_schema_extra={"original_field": "dependencies"}
     )
 
     # Timestamps
@@ -110,11 +119,7 @@ class Task(Document):
     @property
     def urgency(self) -> float:
         """Computed urgency score 0-10."""
-        if self.date.finish is None:
-            return 0.5
-        if self.date.is_overdue():
-            return 10.0
-        return 5.0
+        return self.date.urgency()
 
     class Settings:
         name = "tasks"
@@ -4,11 +4,26 @@ These are fixtures for testing Pulpo framework functionality.
 They mirror the structure of real operations without importing the actual project.
 """
 
+import heapq
+import re
+from operator import attrgetter
 from typing import Optional
-from pydantic import BaseModel, Field
+
+from beanie import PydanticObjectId
+from bson import DBRef
+from pydantic import BaseModel, ConfigDict, Field
 
 from core.decorators import operation
-from .sample_models import Task, TaskStatusEnum
+from .sample_models import DateRange, Task, TaskStatusEnum
+
+
+# Result message templates
+_READY_MSG = "Found {count} tasks ready"
+_LOADED_MSG = "Loaded {count} tasks from Markdown"
+_ARCHIVED_MSG = "Archived {count} tasks"
+
+# Markdown checkbox line: "- [ ] title" or "- [x] title"
+_CHECKBOX_RE = re.compile(r"^- \[([ xX])\]\s+(.+)$", re.MULTILINE)
 
 
 # Input/Output schemas
@@ -30,6 +45,41 @@ class TaskSummary(BaseModel):
     urgency: float = Field(..., description="Urgency 0-10")
 
 
+class TaskSummaryProjection(BaseModel):
+    """Task fields read to build a TaskSummary (MongoDB projection)."""
+
+    id: PydanticObjectId = Field(..., alias="_id")
+    title: str
+    importance_rate: int = 0
+    date: DateRange = Field(default_factory=DateRange)
+
+    @property
+    def urgency(self) -> float:
+        """Same score as Task.urgency, computed from the projected dates."""
+        return self.date.urgency()
+
+
+class TaskDependencyProjection(TaskSummaryProjection):
+    """Summary fields plus raw dependency references."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    dependencies: list[DBRef] = Field(default_factory=list)
+
+
+def _to_summaries(tasks: list[TaskSummaryProjection]) -> list[TaskSummary]:
+    """Build TaskSummary rows from projection data."""
+    return [
+        TaskSummary(
+            task_id=str(task.id),
+            title=task.title,
+            importance_rate=task.importance_rate,
+            urgency=task.urgency
+        )
+        for task in tasks
+    ]
+
+
 class CheckNeededTasksOutput(BaseModel):
     """Output for checking tasks."""
 
@@ -86,38 +136,32 @@ async def check_needed_tasks(input_data: CheckNeededTasksInput) -> CheckNeededTa
     - Async function handling
     - Input/output schema validation
     - models_in/models_out tracking
+    - Batched relationship lookups
     """
     query = {"status": input_data.status_filter or "pending"}
-    available_tasks = await Task.find(query).to_list()
-
-    needed = []
-    for task in available_tasks:
-        if not task.dependencies:
-            needed.append(task)
-        else:
-            all_deps_done = True
-            for dep_link in task.dependencies:
-                dep_task = await dep_link.fetch()
-                if dep_task.status != TaskStatusEnum.COMPLETED:
-                    all_deps_done = False
-                    break
-            if all_deps_done:
-                needed.append(task)
-
-    task_summaries = [
-        TaskSummary(
-            task_id=str(task.id),
-            title=task.title,
-            importance_rate=task.importance_rate,
-            urgency=task.urgency
-        )
-        for task in needed
+    available_tasks = await Task.find(query).project(TaskDependencyProjection).to_list()
+
+    # Resolve every dependency of every task with one query instead of one
+    # fetch per link
+    dep_ids = {ref.id for task in available_tasks for ref in task.dependencies}
+    done_ids = set()
+    if dep_ids:
+        done_ids = set(await Task.distinct(
+            "_id",
+            {"_id": {"$in": list(dep_ids)}, "status": TaskStatusEnum.COMPLETED}
+        ))
+
+    needed = [
+        task for task in available_tasks
+        if all(ref.id in done_ids for ref in task.dependencies)
     ]
 
+    task_summaries = _to_summaries(needed)
+
     return CheckNeededTasksOutput(
         tasks=task_summaries,
         count=len(task_summaries),
-        message=f"Found {len(task_summaries)} tasks ready"
+        message=_READY_MSG.format(count=len(task_summaries))
     )
 
 
@@ -141,22 +185,15 @@ async def next_by_urgency(input_data: NextTaskInput) -> NextTaskOutput:
     """
     query = {
         "status": {"$in": ["pending", "in_progress"]},
-        "_id": {"$nin": [id for id in input_data.exclude_ids]}
+        "_id": {"$nin": input_data.exclude_ids}
     }
 
-    tasks = await Task.find(query).to_list()
-    sorted_tasks = sorted(tasks, key=lambda t: t.urgency, reverse=True)
-    sorted_tasks = sorted_tasks[:input_data.limit]
+    # Urgency depends on the current time, so it is scored here from the
+    # projected dates rather than sorted on the stored (stale) snapshot
+    tasks = await Task.find(query).project(TaskSummaryProjection).to_list()
+    sorted_tasks = heapq.nlargest(input_data.limit, tasks, key=attrgetter("urgency"))
 
-    task_summaries = [
-        TaskSummary(
-            task_id=str(task.id),
-            title=task.title,
-            importance_rate=task.importance_rate,
-            urgency=task.urgency
-        )
-        for task in sorted_tasks
-    ]
+    task_summaries = _to_summaries(sorted_tasks)
 
     return NextTaskOutput(
         tasks=task_summaries,
@@ -182,30 +219,24 @@ async def load_markdown(input_data: LoadDocumentInput) -> LoadOutput:
     - Regex parsing
     - Batch document creation
     """
-    import re
-
-    pattern = r"^- \[([ xX])\]\s+(.+)$"
-    matches = re.findall(pattern, input_data.content, re.MULTILINE)
-
-    tasks_data = [
-        {"title": title.strip(), "completed": status.lower() == "x"}
-        for status, title in matches
-    ]
-
-    created_ids = []
-    for task_data in tasks_data:
-        task = Task(
-            title=task_data["title"],
-            status=TaskStatusEnum.COMPLETED if task_data["completed"] else TaskStatusEnum.PENDING,
+    tasks = [
+        Task(
+            title=title.strip(),
+            status=TaskStatusEnum.COMPLETED if status.lower() == "x" else TaskStatusEnum.PENDING,
             category_id=input_data.category_id,
             importance_rate=input_data.importance_rate
         )
-        result = await task.insert()
-        created_ids.append(str(result.id))
+        for status, title in _CHECKBOX_RE.findall(input_data.content)
+    ]
+
+    created_ids = []
+    if tasks:
+        result = await Task.insert_many(tasks)
+        created_ids = [str(task_id) for task_id in result.inserted_ids]
 
     return LoadOutput(
         created_count=len(created_ids),
-        message=f"Loaded {len(created_ids)} tasks from Markdown",
+        message=_LOADED_MSG.format(count=len(created_ids)),
         task_ids=created_ids
     )
 
@@ -228,10 +259,8 @@ async def archive_completed() -> dict:
     - No input schema (uses BaseModel)
     - Empty models_out
     """
-    completed = await Task.find({"status": TaskStatusEnum.COMPLETED}).to_list()
-    count = len(completed)
-
-    for task in completed:
-        await task.delete()
+    # One delete_many on the server; its result carries the count
+    result = await Task.find({"status": TaskStatusEnum.COMPLETED}).delete()
+    count = result.deleted_count if result is not None else 0
 
-    return {"archived_count": count, "message": f"Archived {count} tasks"}
+    return {"archived_count": count, "message": _ARCHIVED_MSG.format(count=count)}
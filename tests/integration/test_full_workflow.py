@@ -11,22 +11,27 @@ Uses sample fixtures from todo-app patterns.
 """
 
 import pytest
-import importlib
-import sys
-from pathlib import Path
 
 from core.analysis.registries import ModelRegistry, OperationRegistry
 from core.analysis.graph_builder import build_graph_from_registries
 
+pytestmark = pytest.mark.registries
+
+
+def _read_head(path, size=4096):
+    """Return the lowercased first `size` bytes of an exported file."""
+    with path.open("rb") as f:
+        return f.read(size).decode("utf-8", "ignore").lower()
+
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("registry_readonly")
 class TestFullWorkflowWithFixtures:
     """Test complete workflow using todo-app-style fixtures."""
 
-    def test_import_sample_models(self, sample_models_module):
+    def test_import_sample_models(self, sample_registries):
         """Test that sample models can be imported and register themselves."""
-        # When: Importing sample models module
-        models_mod = importlib.import_module(sample_models_module)
+        # When: Sample models module has been imported (once per session)
 
         # Then: Models are registered
         assert len(ModelRegistry.models) > 0
@@ -40,10 +45,9 @@ class TestFullWorkflowWithFixtures:
         assert task_meta["description"] == "Task with dependencies and computed fields"
         assert "test" in task_meta["tags"]
 
-    def test_import_sample_operations(self, sample_operations_module):
+    def test_import_sample_operations(self, sample_registries):
         """Test that sample operations can be imported and register themselves."""
-        # When: Importing sample operations module
-        ops_mod = importlib.import_module(sample_operations_module)
+        # When: Sample operations module has been imported (once per session)
 
         # Then: Operations are registered
         assert len(OperationRegistry.operations) > 0
@@ -57,14 +61,10 @@ class TestFullWorkflowWithFixtures:
         assert check_meta["category"] == "task-analysis"
         assert "Task" in check_meta["models_in"]
 
-    def test_build_graph_from_fixtures(self, sample_models_module, sample_operations_module):
+    def test_build_graph_from_fixtures(self, sample_graph):
         """Test building graph from imported fixtures."""
-        # Given: Imported models and operations
-        importlib.import_module(sample_models_module)
-        importlib.import_module(sample_operations_module)
-
-        # When: Building graph
-        graph = build_graph_from_registries("todo-app-test")
+        # Given/When: Graph built from imported models and operations
+        graph = sample_graph
 
         # Then: Graph contains expected nodes
         assert graph.graph.number_of_nodes() > 0
@@ -83,12 +83,10 @@ class TestFullWorkflowWithFixtures:
         flows = graph.get_nodes_by_type("flow")
         assert len(flows) > 0
 
-    def test_validate_graph_from_fixtures(self, sample_models_module, sample_operations_module):
+    def test_validate_graph_from_fixtures(self, sample_graph):
         """Test validating graph built from fixtures."""
         # Given: Graph from fixtures
-        importlib.import_module(sample_models_module)
-        importlib.import_module(sample_operations_module)
-        graph = build_graph_from_registries("todo-app-test")
+        graph = sample_graph
 
         # When: Validating graph
         is_valid, errors, warnings = graph.validate()
@@ -104,12 +102,10 @@ class TestFullWorkflowWithFixtures:
                 assert isinstance(error, str)
                 assert len(error) > 0
 
-    def test_graph_queries_with_fixtures(self, sample_models_module, sample_operations_module):
+    def test_graph_queries_with_fixtures(self, sample_graph):
         """Test querying graph built from fixtures."""
         # Given: Graph from fixtures
-        importlib.import_module(sample_models_module)
-        importlib.import_module(sample_operations_module)
-        graph = build_graph_from_registries("todo-app-test")
+        graph = sample_graph
 
         # When: Querying tasks by flow
         flows = graph.get_nodes_by_type("flow")
@@ -126,10 +122,9 @@ class TestFullWorkflowWithFixtures:
         # Then: Expected models are present
         assert len(datamodels) >= 3  # Category, Task, Alarm minimum
 
-    def test_operation_categorization(self, sample_operations_module):
+    def test_operation_categorization(self, sample_registries):
         """Test that operations are correctly categorized."""
         # Given: Imported operations
-        importlib.import_module(sample_operations_module)
 
         # When: Getting operations by category
         analysis_ops = OperationRegistry.get_by_category("task-analysis")
@@ -146,10 +141,9 @@ class TestFullWorkflowWithFixtures:
         if prioritization_ops:
             assert "tasks.analysis.next_by_urgency" in prioritization_ops
 
-    def test_models_have_complete_metadata(self, sample_models_module):
+    def test_models_have_complete_metadata(self, sample_registries):
         """Test that model metadata is complete."""
         # Given: Imported models
-        importlib.import_module(sample_models_module)
 
         # When: Getting Task model metadata
         task_meta = ModelRegistry.get("Task")
@@ -161,10 +155,9 @@ class TestFullWorkflowWithFixtures:
         assert task_meta["name"] == "Task"
         assert len(task_meta["description"]) > 0
 
-    def test_operations_have_complete_metadata(self, sample_operations_module):
+    def test_operations_have_complete_metadata(self, sample_registries):
         """Test that operation metadata is complete."""
         # Given: Imported operations
-        importlib.import_module(sample_operations_module)
 
         # When: Getting operation metadata
         check_meta = OperationRegistry.get("tasks.analysis.check_needed")
@@ -183,11 +176,10 @@ class TestFullWorkflowWithFixtures:
 class TestGraphPersistence:
     """Test graph save/load functionality."""
 
-    def test_save_and_load_graph(self, sample_models_module, tmp_path):
+    def test_save_and_load_graph(self, sample_graph, tmp_path):
         """Test saving and loading graph."""
-        # Given: Graph from fixtures
-        importlib.import_module(sample_models_module)
-        graph = build_graph_from_registries("test-project")
+        # Given: Graph built once from fixtures
+        graph = sample_graph
 
         # When: Saving graph
         save_path = tmp_path / "test_graph.json"
@@ -202,14 +194,13 @@ class TestGraphPersistence:
         loaded_graph = GraphPersistence.load(save_path)
 
         # Then: Graph is restored
-        assert loaded_graph.metadata["project_name"] == "test-project"
+        assert loaded_graph.metadata["project_name"] == "todo-app-test"
         assert loaded_graph.graph.number_of_nodes() == graph.graph.number_of_nodes()
 
-    def test_graph_export_mermaid(self, sample_models_module, tmp_path):
+    def test_graph_export_mermaid(self, sample_graph, tmp_path):
         """Test exporting graph to Mermaid format."""
-        # Given: Graph from fixtures
-        importlib.import_module(sample_models_module)
-        graph = build_graph_from_registries("test-project")
+        # Given: Graph built once from fixtures
+        graph = sample_graph
 
         # When: Exporting to Mermaid
         mermaid_path = tmp_path / "graph.mmd"
@@ -217,15 +208,14 @@ class TestGraphPersistence:
 
         # Then: File is created with content
         assert mermaid_path.exists()
-        content = mermaid_path.read_text()
-        assert len(content) > 0
-        assert "graph" in content.lower() or "flowchart" in content.lower()
+        assert mermaid_path.stat().st_size > 0
+        head = _read_head(mermaid_path)
+        assert "graph" in head or "flowchart" in head
 
-    def test_graph_export_dot(self, sample_models_module, tmp_path):
+    def test_graph_export_dot(self, sample_graph, tmp_path):
         """Test exporting graph to DOT format."""
-        # Given: Graph from fixtures
-        importlib.import_module(sample_models_module)
-        graph = build_graph_from_registries("test-project")
+        # Given: Graph built once from fixtures
+        graph = sample_graph
 
         # When: Exporting to DOT
         dot_path = tmp_path / "graph.dot"
@@ -233,18 +223,16 @@ class TestGraphPersistence:
 
         # Then: File is created with DOT syntax
         assert dot_path.exists()
-        content = dot_path.read_text()
-        assert len(content) > 0
-        assert "digraph" in content or "graph" in content
+        assert dot_path.stat().st_size > 0
+        head = _read_head(dot_path)
+        assert "digraph" in head or "graph" in head
 
 
 @pytest.mark.integration
 @pytest.mark.slow
-def test_end_to_end_workflow(sample_models_module, sample_operations_module, tmp_path):
+def test_end_to_end_workflow(sample_registries, tmp_path):
     """Test complete end-to-end workflow from decorators to graph export."""
-    # Step 1: Import models and operations
-    importlib.import_module(sample_models_module)
-    importlib.import_module(sample_operations_module)
+    # Step 1: Import models and operations (once per session)
 
     # Verify registries populated
     assert len(ModelRegistry.models) >= 3
@@ -0,0 +1,139 @@
+"""Integration tests for the sample task operations.
+
+Runs the todo-app-style operations from tests/fixtures against an in-memory
+MongoDB (mongomock-motor) to check their query results, not just their
+registration.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("mongomock_motor")
+
+from beanie import init_beanie  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+
+@pytest.fixture
+def run_operation(imported_fixtures):
+    """Call a sample operation by name with keyword inputs."""
+    _, operations = imported_fixtures
+
+    async def _run(name, **inputs):
+        meta = operations[name]
+        return await meta.function(meta.input_schema(**inputs))
+
+    return _run
+
+
+@pytest.fixture
+async def task_model(imported_fixtures):
+    """Sample Task document bound to a fresh in-memory database."""
+    models, _ = imported_fixtures
+    client = AsyncMongoMockClient()
+    await init_beanie(
+        database=client.get_database("test_sample_operations"),
+        document_models=[info.document_cls for info in models.values()],
+    )
+    yield models["Task"].document_cls
+    client.close()
+
+
+async def _insert_task(task_model, title, **fields):
+    return await task_model(title=title, **fields).insert()
+
+
+@pytest.mark.integration
+class TestNextByUrgency:
+    """Test tasks.analysis.next_by_urgency ordering."""
+
+    async def test_orders_by_current_urgency(self, task_model, run_operation):
+        """Test that overdue tasks rank first, scored with Task.urgency."""
+        # Given: Tasks without a deadline, due tomorrow and overdue
+        now = datetime.utcnow()
+        await _insert_task(task_model, "someday")
+        await _insert_task(task_model, "tomorrow", date={"finish": now + timedelta(days=1)})
+        overdue = await _insert_task(
+            task_model, "overdue", date={"finish": now - timedelta(days=1)}
+        )
+
+        # When: Asking for the next tasks
+        result = await run_operation("tasks.analysis.next_by_urgency")
+
+        # Then: Tasks come back most urgent first, with the model's scores
+        assert [t.title for t in result.tasks] == ["overdue", "tomorrow", "someday"]
+        assert [t.urgency for t in result.tasks] == [10.0, 5.0, 0.5]
+        assert result.tasks[0].urgency == overdue.urgency
+
+    async def test_limit_keeps_most_urgent(self, task_model, run_operation):
+        """Test that the limit drops the least urgent tasks."""
+        # Given: An overdue task inserted after two tasks without deadlines
+        now = datetime.utcnow()
+        await _insert_task(task_model, "first")
+        await _insert_task(task_model, "second")
+        await _insert_task(task_model, "overdue", date={"finish": now - timedelta(hours=1)})
+
+        # When: Asking for two tasks
+        result = await run_operation("tasks.analysis.next_by_urgency", limit=2)
+
+        # Then: The overdue task leads and ties keep insertion order
+        assert [t.title for t in result.tasks] == ["overdue", "first"]
+
+
+@pytest.mark.integration
+class TestCheckNeededTasks:
+    """Test tasks.analysis.check_needed dependency resolution."""
+
+    async def test_ready_and_blocked_dependencies(self, task_model, run_operation):
+        """Test that only tasks whose dependencies are all completed are ready."""
+        # Given: One completed and one pending prerequisite
+        done = await _insert_task(task_model, "done", status="completed")
+        open_dep = await _insert_task(task_model, "open")
+
+        # And: Tasks with no, finished, unfinished and mixed dependencies
+        await _insert_task(task_model, "ready", dependencies=[done])
+        await _insert_task(task_model, "blocked", dependencies=[open_dep])
+        await _insert_task(task_model, "partly blocked", dependencies=[done, open_dep])
+
+        # When: Checking pending tasks
+        result = await run_operation("tasks.analysis.check_needed")
+
+        # Then: Blocked tasks are left out
+        assert [t.title for t in result.tasks] == ["open", "ready"]
+        assert result.count == 2
+        assert result.message == "Found 2 tasks ready"
+
+    async def test_summary_fields(self, task_model, run_operation):
+        """Test that summaries carry the id, title, importance and urgency."""
+        # Given: An overdue pending task
+        task = await _insert_task(
+            task_model,
+            "overdue",
+            importance_rate=4,
+            date={"finish": datetime.utcnow() - timedelta(days=1)},
+        )
+
+        # When: Checking pending tasks
+        result = await run_operation("tasks.analysis.check_needed")
+
+        # Then: The summary mirrors the stored task
+        [summary] = result.tasks
+        assert summary.model_dump() == {
+            "task_id": str(task.id),
+            "title": "overdue",
+            "importance_rate": 4,
+            "urgency": 10.0,
+        }
+
+    async def test_status_filter(self, task_model, run_operation):
+        """Test that status_filter selects which tasks are checked."""
+        # Given: A pending and an in-progress task
+        await _insert_task(task_model, "pending")
+        await _insert_task(task_model, "started", status="in_progress")
+
+        # When: Checking in-progress tasks
+        result = await run_operation("tasks.analysis.check_needed", status_filter="in_progress")
+
+        # Then: Only the in-progress task is returned
+        assert [t.title for t in result.tasks] == ["started"]
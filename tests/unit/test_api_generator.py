@@ -0,0 +1,81 @@
+"""Unit tests for the generated FastAPI operation endpoints."""
+
+import pytest
+from pydantic import BaseModel
+
+from core.analysis.registries import OperationMetadata, OperationRegistry
+from core.generation.compile.api_generator import FastAPIGenerator
+
+pytestmark = pytest.mark.registries
+
+
+class CalcInput(BaseModel):
+    a: int
+
+
+class CalcOutput(BaseModel):
+    b: int
+
+
+async def calc_direct(data: CalcInput) -> CalcOutput:  # pragma: no cover - not executed here
+    return CalcOutput(b=data.a)
+
+
+async def calc_registry(data: CalcInput) -> CalcOutput:  # pragma: no cover - not executed here
+    return CalcOutput(b=data.a)
+
+
+def _register(name, function, pure):
+    OperationRegistry.register(
+        OperationMetadata(
+            name=name,
+            description=f"{name} operation",
+            category="test",
+            input_schema=CalcInput,
+            output_schema=CalcOutput,
+            function=function,
+            pure=pure,
+        )
+    )
+
+
+@pytest.mark.unit
+class TestOperationEndpoints:
+    """Test dispatch code generated for pure and non-pure operations."""
+
+    def test_pure_op_is_called_directly(self, tmp_path):
+        """Test that pure ops are imported once and awaited without the registry."""
+        # Given: One pure and one non-pure operation
+        _register("calc_pure", calc_direct, pure=True)
+        _register("calc_dispatched", calc_registry, pure=False)
+
+        # When: Generating the API
+        code = FastAPIGenerator(output_dir=tmp_path).generate().read_text()
+
+        # Then: The generated module is valid Python
+        compile(code, "generated_api.py", "exec")
+
+        # And: The pure op is bound at import time and awaited directly
+        assert f"from {__name__} import calc_direct as _calc_pure_fn" in code
+        assert "result = await _calc_pure_fn(input_data)" in code
+        assert 'OperationRegistry.get("calc_pure")' not in code
+
+        # And: The non-pure op is still dispatched through the registry
+        assert "calc_registry as" not in code
+        assert 'op_meta = OperationRegistry.get("calc_dispatched")' in code
+        assert "result = await op_meta.function(input_data)" in code
+
+    def test_flipping_pure_regenerates(self, tmp_path):
+        """Test that changing an op's pure flag invalidates the generated API."""
+        # Given: An API generated while the op was dispatched
+        _register("calc", calc_direct, pure=False)
+        output_file = FastAPIGenerator(output_dir=tmp_path).generate()
+
+        # When: The op is re-registered as pure
+        OperationRegistry.clear()
+        _register("calc", calc_direct, pure=True)
+        gen = FastAPIGenerator(output_dir=tmp_path)
+
+        # Then: The API is regenerated with the direct call
+        assert gen.needs_regeneration(output_file)
+        assert "result = await _calc_fn(input_data)" in gen.generate().read_text()
@@ -1,7 +1,10 @@
+import pytest
 from pydantic import BaseModel
 
 from core.analysis.registries import ModelInfo, ModelRegistry, OperationMetadata, OperationRegistry
 
+pytestmark = pytest.mark.registries
+
 
 def test_model_registry_register_and_get_and_clear():
     ModelRegistry.clear()
@@ -49,3 +52,24 @@ def test_operation_registry_register_and_get_and_clear():
     OperationRegistry.clear()
     assert OperationRegistry.get("op1") is None
 
+
+def test_registry_snapshot_and_restore():
+    ModelRegistry.register(ModelInfo(name="Foo", document_cls=object))
+    snapshot = ModelRegistry.snapshot()
+
+    ModelRegistry.clear()
+    ModelRegistry.register(ModelInfo(name="Bar", document_cls=object))
+    ModelRegistry.restore(snapshot)
+
+    assert ModelRegistry.get("Foo") is not None
+    assert ModelRegistry.get("Bar") is None
+    assert ModelRegistry.snapshot() is not snapshot
+
+
+def test_registry_iter_all_matches_list_all():
+    ModelRegistry.register(ModelInfo(name="Foo", document_cls=object))
+    ModelRegistry.register(ModelInfo(name="Bar", document_cls=object))
+
+    assert [m.name for m in ModelRegistry.iter_all()] == ["Foo", "Bar"]
+    assert list(ModelRegistry.iter_all()) == ModelRegistry.list_all()
+    assert list(OperationRegistry.iter_all()) == []
@@ -11,6 +11,8 @@ from pydantic import BaseModel, Field
 from core.decorators import datamodel, operation
 from core.analysis.registries import ModelRegistry, OperationRegistry
 
+pytestmark = pytest.mark.registries
+
 
 @pytest.mark.unit
 class TestDatamodelDecorator:
@@ -1,8 +1,11 @@
+import pytest
 from pydantic import BaseModel
 
 from core import datamodel, operation
 from core.analysis.registries import ModelRegistry, OperationRegistry
 
+pytestmark = pytest.mark.registries
+
 
 def test_datamodel_decorator_registers_class():
     ModelRegistry.clear()
@@ -57,6 +60,26 @@ def test_operation_decorator_registers_function_and_class():
         async def run(self, _: In) -> Out:  # pragma: no cover - not executed here
             return Out(b=2)
 
-    names = {op.name for op in OperationRegistry.list_all()}
+    names = {op.name for op in OperationRegistry.iter_all()}
     assert {"f_op", "c_op"}.issubset(names)
 
+
+def test_operation_decorator_records_pure_flag():
+    OperationRegistry.clear()
+
+    class In(BaseModel):
+        a: int
+
+    class Out(BaseModel):
+        b: int
+
+    @operation(name="pure_op", description="p", category="test", inputs=In, outputs=Out, pure=True)
+    async def p(_: In) -> Out:  # pragma: no cover - not executed here
+        return Out(b=1)
+
+    @operation(name="impure_op", description="i", category="test", inputs=In, outputs=Out)
+    async def i(_: In) -> Out:  # pragma: no cover - not executed here
+        return Out(b=2)
+
+    assert OperationRegistry.get("pure_op").pure is True
+    assert OperationRegistry.get("impure_op").pure is False
@@ -0,0 +1,94 @@
+"""Unit tests for CodeGenerator hash-based change detection."""
+
+import pytest
+from pydantic import BaseModel
+
+from core.analysis.registries import ModelInfo, ModelRegistry, OperationMetadata, OperationRegistry
+from core.generation.base import CodeGenerator, _qualified_name
+
+pytestmark = pytest.mark.registries
+
+
+class In(BaseModel):
+    a: int
+
+
+class Out(BaseModel):
+    b: int
+
+
+async def handler(_: In) -> Out:  # pragma: no cover - not executed here
+    return Out(b=1)
+
+
+@pytest.mark.unit
+class TestQualifiedName:
+    """Test import paths used in the metadata hash."""
+
+    def test_class_and_function(self):
+        """Test module-qualified names for classes and functions."""
+        assert _qualified_name(In) == f"{__name__}.In"
+        assert _qualified_name(handler) == f"{__name__}.handler"
+
+    def test_instance_falls_back_to_type(self):
+        """Test that objects without __qualname__ use their type's name."""
+        assert _qualified_name(In(a=1)) == f"{__name__}.In"
+
+
+@pytest.mark.unit
+class TestMetadataHash:
+    """Test CodeGenerator.needs_regeneration() and save_hash()."""
+
+    def test_saved_hash_matches_until_registry_changes(self, tmp_path):
+        """Test that a saved hash is current until the registries change."""
+        # Given: A generated file with its hash saved
+        ModelRegistry.register(ModelInfo(name="Item", document_cls=In))
+        gen = CodeGenerator(tmp_path)
+        output_file = tmp_path / "generated.py"
+        output_file.write_text("# generated")
+        metadata_hash = gen.get_metadata_hash()
+        gen.save_hash(output_file, metadata_hash)
+
+        # Then: Nothing to regenerate
+        assert not gen.needs_regeneration(output_file, metadata_hash)
+        assert not gen.needs_regeneration(output_file)
+
+        # When: An operation is registered
+        OperationRegistry.register(
+            OperationMetadata(
+                name="op",
+                description="d",
+                category="test",
+                input_schema=In,
+                output_schema=Out,
+                function=handler,
+            )
+        )
+
+        # Then: The stored hash is stale
+        assert gen.needs_regeneration(output_file)
+
+    def test_save_hash_defaults_to_current_registries(self, tmp_path):
+        """Test that save_hash() without a hash stores the current state."""
+        gen = CodeGenerator(tmp_path)
+        output_file = tmp_path / "generated.py"
+        output_file.write_text("# generated")
+        stale_hash = gen.get_metadata_hash()
+
+        ModelRegistry.register(ModelInfo(name="Item", document_cls=In))
+        gen.save_hash(output_file)
+
+        stored = output_file.with_suffix(".hash").read_text()
+        assert stored == gen.get_metadata_hash()
+        assert stored != stale_hash
+
+    def test_schema_module_is_part_of_hash(self, tmp_path):
+        """Test that moving a model class to another module changes the hash."""
+        ModelRegistry.register(ModelInfo(name="Item", document_cls=In))
+        gen = CodeGenerator(tmp_path)
+        before = gen.get_metadata_hash()
+
+        moved = type("In", (BaseModel,), {"__module__": "elsewhere.models"})
+        ModelRegistry.restore({"Item": ModelInfo(name="Item", document_cls=moved)})
+
+        assert gen.get_metadata_hash() != before
@@ -9,6 +9,8 @@ from core.analysis.graph_builder import build_graph_from_registries
 from core.analysis.registry_graph import RegistryGraph
 from core.analysis.registries import ModelRegistry, OperationRegistry
 
+pytestmark = pytest.mark.registries
+
 
 @pytest.mark.unit
 class TestGraphBuilder:
@@ -16,7 +18,7 @@ class TestGraphBuilder:
 
     def test_build_empty_graph(self):
         """Test building graph with empty registries."""
-        # Given: Empty registries (via reset_registries fixture)
+        # Given: Empty registries (via clean_registries fixture)
 
         # When: Building graph
         graph = build_graph_from_registries("test_project")
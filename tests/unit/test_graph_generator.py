@@ -0,0 +1,36 @@
+"""Unit tests for Mermaid diagram generation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.analysis.graphs.graph_generator import MermaidGraphGenerator
+
+
+@pytest.mark.unit
+class TestOperationFlow:
+    """Test operation flow rendering from registry entries and rows."""
+
+    def test_rows_render_same_diagram_as_registry_entries(self, tmp_path):
+        """Test that the row-based entry point matches generate_operation_flow()."""
+        models = [SimpleNamespace(name="Task"), SimpleNamespace(name="Report")]
+        operations = [
+            SimpleNamespace(
+                name="report.build",
+                description="Build a report",
+                category="reports",
+                models_in=["Task"],
+                models_out=["Report"],
+            ),
+            SimpleNamespace(name="noop", models_in=[], models_out=[]),
+        ]
+
+        generator = MermaidGraphGenerator(tmp_path)
+        expected = generator.generate_operation_flow(models, operations).read_text()
+        rows = MermaidGraphGenerator.operation_rows(operations)
+        actual = generator.generate_operation_flow_from_rows(["Task", "Report"], rows).read_text()
+
+        assert actual == expected
+        assert "    Task -->|report.build| Report" in actual
+        assert "**Description**: No description" in actual
+        assert "**Category**: general" in actual
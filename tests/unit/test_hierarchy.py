@@ -0,0 +1,84 @@
+"""Unit tests for HierarchyParser.
+
+Tests parsing and validation of hierarchical operation names.
+"""
+
+import pytest
+
+from core.analysis.graphs.hierarchy import HierarchyParser
+
+VALID_NAMES = [
+    "validate",
+    "parsing.clean",
+    "scraping.stepstone.fetch",
+    "pokemon.management.catch",
+    "tasks_v2.load_markdown",
+]
+
+# (name, level, parent, root, is_standalone)
+PARSE_CASES = [
+    ("validate", 1, None, "validate", True),
+    ("parsing.clean", 2, "parsing", "parsing", False),
+    ("scraping.stepstone.fetch", 3, "scraping.stepstone", "scraping", False),
+    ("pokemon.management.catch", 3, "pokemon.management", "pokemon", False),
+]
+
+INVALID_NAMES = [
+    "",
+    "...",
+    "scraping-stepstone.fetch",
+    "tasks.load markdown",
+    ".".join(["level"] * (HierarchyParser.MAX_LEVEL + 1)),
+]
+
+
+@pytest.mark.unit
+class TestHierarchyParser:
+    """Test HierarchyParser name parsing."""
+
+    @pytest.mark.parametrize("name", VALID_NAMES)
+    def test_valid_name_round_trips(self, name):
+        """Test that valid names parse back to the same components."""
+        # When: Parsing a valid name
+        parsed = HierarchyParser.parse(name)
+
+        # Then: Components match the dotted name
+        assert parsed.full_name == name
+        assert parsed.hierarchy == tuple(name.split("."))
+        assert parsed.level == len(parsed.hierarchy)
+        assert parsed.step == parsed.hierarchy[-1]
+        assert parsed.is_standalone == (parsed.level == 1)
+
+    @pytest.mark.parametrize("name", INVALID_NAMES)
+    def test_invalid_name_rejected(self, name):
+        """Test that invalid names raise ValueError."""
+        with pytest.raises(ValueError):
+            HierarchyParser.parse(name)
+
+    @pytest.mark.parametrize("name,level,parent,root,standalone", PARSE_CASES)
+    def test_parsed_properties(self, name, level, parent, root, standalone):
+        """Test level, parent, root and standalone flag from one parse."""
+        # When: Parsing the name once
+        parsed = HierarchyParser.parse(name)
+
+        # Then: Every derived property matches the table row
+        assert parsed.level == level
+        assert parsed.parent == parent
+        assert parsed.root == root
+        assert parsed.is_standalone == standalone
+
+    def test_is_child_of_matches_whole_components(self):
+        """Test that is_child_of() does not match a partial component."""
+        parsed = HierarchyParser.parse("scraping.stepstone.fetch")
+
+        assert parsed.all_parents == ["scraping", "scraping.stepstone"]
+        assert parsed.is_child_of("scraping")
+        assert not parsed.is_child_of("scrap")
+
+    def test_parse_is_cached(self):
+        """Test that repeated names share one immutable ParsedName."""
+        parsed = HierarchyParser.parse("scraping.stepstone.fetch")
+
+        assert HierarchyParser.parse("scraping.stepstone.fetch") is parsed
+        with pytest.raises(AttributeError):
+            parsed.level = 1
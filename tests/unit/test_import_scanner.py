@@ -0,0 +1,69 @@
+"""Unit tests for import-based discovery helpers."""
+
+import sys
+
+import pytest
+
+from core.analysis.discovery.import_scanner import cached_import
+
+
+@pytest.mark.unit
+class TestCachedImport:
+    """Test cached_import() reuse of sys.modules."""
+
+    def test_imports_and_registers_module(self, tmp_path):
+        """Test that a file is executed and registered under the given name."""
+        py_file = tmp_path / "sample_mod.py"
+        py_file.write_text("VALUE = 1\n")
+
+        module = cached_import("pulpo_test_sample_mod", py_file)
+
+        try:
+            assert module.VALUE == 1
+            assert sys.modules["pulpo_test_sample_mod"] is module
+        finally:
+            sys.modules.pop("pulpo_test_sample_mod", None)
+
+    def test_second_import_reuses_module(self, tmp_path):
+        """Test that importing the same file twice does not re-execute it."""
+        py_file = tmp_path / "cached_mod.py"
+        py_file.write_text("TOKEN = object()\n")
+
+        try:
+            first = cached_import("pulpo_test_cached_mod", py_file)
+            second = cached_import("pulpo_test_cached_mod", py_file)
+
+            assert first is second
+            assert first.TOKEN is second.TOKEN
+        finally:
+            sys.modules.pop("pulpo_test_cached_mod", None)
+
+    def test_edited_file_is_reimported(self, tmp_path):
+        """Test that a file changed since its import is executed again."""
+        # Given: A module imported once
+        py_file = tmp_path / "edited_mod.py"
+        py_file.write_text("VALUE = 1\n")
+
+        try:
+            first = cached_import("pulpo_test_edited_mod", py_file)
+
+            # When: The file is edited and imported again
+            py_file.write_text("VALUE = 22\n")
+            second = cached_import("pulpo_test_edited_mod", py_file)
+
+            # Then: The new source runs in a fresh module
+            assert second is not first
+            assert second.VALUE == 22
+            assert sys.modules["pulpo_test_edited_mod"] is second
+        finally:
+            sys.modules.pop("pulpo_test_edited_mod", None)
+
+    def test_failed_import_is_not_cached(self, tmp_path):
+        """Test that a module raising at import time is removed from sys.modules."""
+        py_file = tmp_path / "broken_mod.py"
+        py_file.write_text("raise RuntimeError('boom')\n")
+
+        with pytest.raises(RuntimeError):
+            cached_import("pulpo_test_broken_mod", py_file)
+
+        assert "pulpo_test_broken_mod" not in sys.modules
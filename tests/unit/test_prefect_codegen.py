@@ -0,0 +1,40 @@
+"""Unit tests for Prefect flow code generation."""
+
+import pytest
+
+from core.generation.compile.compiler import FlowDefinition, Orchestration
+from core.generation.compile.prefect_codegen import PrefectCodeGenerator
+
+
+@pytest.mark.unit
+class TestParallelGroups:
+    """Test code emitted for operations that run in parallel."""
+
+    def test_parallel_group_uses_task_group(self):
+        """Test that a parallel group renders as an asyncio.TaskGroup block."""
+        # Given: Two independent fetches followed by a merge that needs both
+        flow_def = FlowDefinition(
+            name="scraping_flow",
+            operations=["fetch_a", "fetch_b", "merge"],
+            hierarchy_path="scraping",
+            parallel_groups=[["fetch_a", "fetch_b"], ["merge"]],
+            dependencies={"merge": ["fetch_a", "fetch_b"]},
+        )
+
+        # When: Generating the flow
+        code = PrefectCodeGenerator().generate_flow(flow_def, Orchestration(flows=[flow_def]))
+
+        # Then: The emitted source compiles
+        compile(code, "scraping_flow.py", "exec")
+
+        # And: Both fetches are started in one TaskGroup and read after it exits
+        lines = [line.strip() for line in code.splitlines()]
+        start = lines.index("async with asyncio.TaskGroup() as tg:")
+        assert lines[start + 1:start + 5] == [
+            "fetch_a_future = tg.create_task(fetch_a_task())",
+            "fetch_b_future = tg.create_task(fetch_b_task())",
+            "fetch_a_result = fetch_a_future.result()",
+            "fetch_b_result = fetch_b_future.result()",
+        ]
+        assert "merge_result = await merge_task(fetch_a_result, fetch_b_result)" in lines
+        assert "asyncio.gather(" not in code
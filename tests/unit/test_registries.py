@@ -7,6 +7,8 @@ import pytest
 
 from core.analysis.registries import ModelRegistry, OperationRegistry
 
+pytestmark = pytest.mark.registries
+
 
 @pytest.mark.unit
 class TestModelRegistry:
@@ -14,7 +16,7 @@ class TestModelRegistry:
 
     def test_register_model(self, mock_model_metadata):
         """Test registering a model."""
-        # Given: Clean registry (via reset_registries fixture)
+        # Given: Clean registry (via clean_registries fixture)
         assert len(ModelRegistry.models) == 0
 
         # When: Registering a model